@@ -24,13 +24,27 @@ branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
 
+def _column_exists(conn: sa.Connection, table: str, column: str) -> bool:
+    if conn.dialect.name == "postgresql":
+        # Targeted lookup instead of reflecting every column of the table.
+        return (
+            conn.execute(
+                sa.text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_schema = current_schema() "
+                    "AND table_name = :table AND column_name = :column"
+                ),
+                {"table": table, "column": column},
+            ).scalar()
+            is not None
+        )
+    return any(col["name"] == column for col in sa.inspect(conn).get_columns(table))
+
+
 def upgrade() -> None:
     conn = op.get_bind()
-    existing_columns = [
-        col["name"] for col in sa.inspect(conn).get_columns("search_source_connectors")
-    ]
 
-    if "enable_summary" not in existing_columns:
+    if not _column_exists(conn, "search_source_connectors", "enable_summary"):
         op.add_column(
             "search_source_connectors",
             sa.Column(
@@ -24,14 +24,28 @@ def render_document(
     Returns ``None`` when the document has no passage to show. Mutates ``registry``
     (find-or-create).
     """
+    lines = render_document_lines(document, view=view, registry=registry)
+    return "\n".join(lines) if lines else None
+
+
+def render_document_lines(
+    document: RenderableDocument,
+    *,
+    view: DocumentView,
+    registry: CitationRegistry,
+) -> list[str]:
+    """The lines of :func:`render_document`, unjoined; empty without passages.
+
+    Lets a container append every block into one list and join once.
+    """
     if not document.passages:
-        return None
+        return []
 
     lines = [_open_tag(document, view)]
     for passage in document.passages:
         lines.append(_render_passage(document, passage, registry))
     lines.append("</document>")
-    return "\n".join(lines)
+    return lines
 
 
 def _open_tag(document: RenderableDocument, view: DocumentView) -> str:
@@ -67,4 +81,4 @@ def _attr(value: str) -> str:
     )
 
 
-__all__ = ["render_document"]
+__all__ = ["render_document", "render_document_lines"]
@@ -1,14 +1,15 @@
 """Wrap search excerpts in the ``<retrieved_context>`` block.
 
-Each document renders through the shared ``render_document``; this module adds the
-container and the one-time header that teaches the model how to read and cite.
+Each document renders through the shared ``render_document_lines``; this module
+adds the container and the one-time header that teaches the model how to read and
+cite, joining everything once.
 """
 
 from __future__ import annotations
 
 from app.agents.chat.multi_agent_chat.shared.citations import CitationRegistry
 
-from .document import render_document
+from .document import render_document_lines
 from .models import RenderableDocument
 
 _HEADER = (
@@ -30,22 +31,14 @@ def render_search_context(
     the block. Mutates ``registry`` (find-or-create), so a passage seen again in a
     later turn keeps its original ``[n]``.
     """
-    blocks = [
-        block
-        for document in documents
-        if (block := render_document(document, view="excerpt", registry=registry))
-        is not None
-    ]
-    if not blocks:
+    parts = ["<retrieved_context>", _HEADER]
+    for document in documents:
+        parts.extend(render_document_lines(document, view="excerpt", registry=registry))
+    if len(parts) == 2:
         return None
 
-    return (
-        "<retrieved_context>\n"
-        + _HEADER
-        + "\n"
-        + "\n".join(blocks)
-        + "\n</retrieved_context>"
-    )
+    parts.append("</retrieved_context>")
+    return "\n".join(parts)
 
 
 __all__ = ["render_search_context"]
@@ -13,15 +13,27 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import contextvars
+import functools
 import logging
+import os
 import shutil
+import stat
+import subprocess
+import tempfile
 import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from daytona import (
     CreateSandboxFromSnapshotParams,
     Daytona,
     DaytonaConfig,
+    Sandbox,
     SandboxState,
 )
 from daytona.common.errors import DaytonaError
@@ -34,6 +46,23 @@ from app.config import config as app_config
 
 logger = logging.getLogger(__name__)
 
+# Blocking Daytona SDK calls get their own pool so sandbox lifecycle work
+# isn't queued behind unrelated ``asyncio.to_thread`` users of the loop's
+# default executor (and vice versa).
+_daytona_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="daytona")
+
+
+async def _run_daytona(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking Daytona call on ``_daytona_executor``.
+
+    Like ``asyncio.to_thread``, the caller's contextvars are propagated.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _daytona_executor, functools.partial(ctx.run, fn, *args, **kwargs)
+    )
+
 
 class _TimeoutAwareSandbox(DaytonaSandbox):
     """DaytonaSandbox subclass that accepts the per-command *timeout*
@@ -57,39 +86,69 @@ class _TimeoutAwareSandbox(DaytonaSandbox):
     async def aexecute(
         self, command: str, *, timeout: int | None = None
     ) -> ExecuteResponse:  # type: ignore[override]
-        return await asyncio.to_thread(self.execute, command, timeout=timeout)
+        return await _run_daytona(self.execute, command, timeout=timeout)
 
     def download_file(self, path: str) -> bytes:
         """Download a file from the sandbox filesystem."""
         return self._sandbox.fs.download_file(path)
 
+    async def adownload_file(self, path: str) -> bytes:
+        """Async variant of :meth:`download_file`."""
+        return await _run_daytona(self.download_file, path)
+
 
 _daytona_client: Daytona | None = None
 _client_lock = threading.Lock()
-_sandbox_cache: dict[str, _TimeoutAwareSandbox] = {}
+_sandbox_cache: OrderedDict[str, _TimeoutAwareSandbox] = OrderedDict()
 _sandbox_locks: dict[str, asyncio.Lock] = {}
-_sandbox_locks_mu = asyncio.Lock()
+_sandbox_lock_refs: dict[str, int] = {}
 _seeded_files: dict[str, dict[str, str]] = {}
 _SANDBOX_CACHE_MAX_SIZE = 20
+_PERSIST_DOWNLOAD_CONCURRENCY = 8
+# Negative cache: thread key -> monotonic time of the last failed create.
+_create_failures: dict[str, float] = {}
+_CREATE_FAILURE_COOLDOWN_SECONDS = 10.0
 THREAD_LABEL_KEY = "surfsense_thread"
+_RESTARTABLE_STATES = frozenset(
+    {SandboxState.STOPPED, SandboxState.STOPPING, SandboxState.ARCHIVED}
+)
+_UNRECOVERABLE_STATES = frozenset(
+    {SandboxState.ERROR, SandboxState.BUILD_FAILED, SandboxState.DESTROYED}
+)
 SANDBOX_DOCUMENTS_ROOT = "/home/daytona/documents"
 
 
+def _as_key(thread_id: int | str) -> str:
+    """Normalize a thread id to the string key used for caches and labels."""
+    return thread_id if isinstance(thread_id, str) else str(thread_id)
+
+
 def is_sandbox_enabled() -> bool:
+    """Whether Daytona sandboxing is on.
+
+    ``DAYTONA_SANDBOX_ENABLED`` is parsed once when ``app.config`` loads,
+    so this is a plain attribute read on the per-message hot path.
+    """
     return app_config.DAYTONA_SANDBOX_ENABLED
 
 
 def _get_client() -> Daytona:
+    """Build the Daytona client once per process.
+
+    Double-checked so the steady state skips the lock, while concurrent
+    executor threads racing the first call still build a single client.
+    """
     global _daytona_client
-    with _client_lock:
-        if _daytona_client is None:
-            config = DaytonaConfig(
-                api_key=app_config.DAYTONA_API_KEY,
-                api_url=app_config.DAYTONA_API_URL,
-                target=app_config.DAYTONA_TARGET,
-            )
-            _daytona_client = Daytona(config)
-        return _daytona_client
+    if _daytona_client is None:
+        with _client_lock:
+            if _daytona_client is None:
+                config = DaytonaConfig(
+                    api_key=app_config.DAYTONA_API_KEY,
+                    api_url=app_config.DAYTONA_API_URL,
+                    target=app_config.DAYTONA_TARGET,
+                )
+                _daytona_client = Daytona(config)
+    return _daytona_client
 
 
 def _sandbox_create_params(
@@ -106,6 +165,37 @@ def _sandbox_create_params(
     )
 
 
+def _create_sandbox(client: Daytona, thread_id: str, labels: dict[str, str]) -> Sandbox:
+    """Create a sandbox, remembering failures for a short cool-down.
+
+    A create takes seconds and usually fails for reasons (quota, outage)
+    that won't clear by the next message, so repeated attempts for the
+    same thread are rejected until ``_CREATE_FAILURE_COOLDOWN_SECONDS``
+    has elapsed or the thread is explicitly evicted.
+    """
+    failed_at = _create_failures.get(thread_id)
+    if (
+        failed_at is not None
+        and time.monotonic() - failed_at < _CREATE_FAILURE_COOLDOWN_SECONDS
+    ):
+        raise RuntimeError(
+            f"Sandbox creation for thread {thread_id} recently failed; cooling down"
+        )
+    try:
+        sandbox = client.create(_sandbox_create_params(labels))
+    except Exception:
+        now = time.monotonic()
+        # Executor threads can prune concurrently; ``pop`` tolerates a key
+        # another thread already removed instead of masking the create error.
+        for key, ts in list(_create_failures.items()):
+            if now - ts >= _CREATE_FAILURE_COOLDOWN_SECONDS:
+                _create_failures.pop(key, None)
+        _create_failures[thread_id] = now
+        raise
+    _create_failures.pop(thread_id, None)
+    return sandbox
+
+
 def _find_or_create(thread_id: str) -> tuple[_TimeoutAwareSandbox, bool]:
     """Find an existing sandbox for *thread_id*, or create a new one.
 
@@ -114,59 +204,69 @@ def _find_or_create(thread_id: str) -> tuple[_TimeoutAwareSandbox, bool]:
     """
     client = _get_client()
     labels = {THREAD_LABEL_KEY: thread_id}
-    is_new = False
 
+    # Only the lookup falls back to creation.  Errors while starting an
+    # existing sandbox propagate so the caller's retry path handles them
+    # instead of silently creating a duplicate sandbox for the thread.
     try:
         sandbox = client.find_one(labels=labels)
-        logger.info("Found existing sandbox %s (state=%s)", sandbox.id, sandbox.state)
-
-        if sandbox.state in (
-            SandboxState.STOPPED,
-            SandboxState.STOPPING,
-            SandboxState.ARCHIVED,
-        ):
-            logger.info("Starting stopped sandbox %s …", sandbox.id)
-            sandbox.start(timeout=60)
-            logger.info("Sandbox %s is now started", sandbox.id)
-        elif sandbox.state in (
-            SandboxState.ERROR,
-            SandboxState.BUILD_FAILED,
-            SandboxState.DESTROYED,
-        ):
-            logger.warning(
-                "Sandbox %s in unrecoverable state %s — creating a new one",
-                sandbox.id,
-                sandbox.state,
-            )
-            try:
-                client.delete(sandbox)
-            except Exception:
-                logger.debug(
-                    "Could not delete broken sandbox %s", sandbox.id, exc_info=True
-                )
-            sandbox = client.create(_sandbox_create_params(labels))
-            is_new = True
-            logger.info("Created replacement sandbox: %s", sandbox.id)
-        elif sandbox.state != SandboxState.STARTED:
-            sandbox.wait_for_sandbox_start(timeout=60)
-
     except DaytonaError:
         logger.info("No existing sandbox for thread %s — creating one", thread_id)
-        sandbox = client.create(_sandbox_create_params(labels))
-        is_new = True
+        sandbox = _create_sandbox(client, thread_id, labels)
         logger.info("Created new sandbox: %s", sandbox.id)
+        return _TimeoutAwareSandbox(sandbox=sandbox), True
+
+    logger.info("Found existing sandbox %s (state=%s)", sandbox.id, sandbox.state)
+    is_new = False
+
+    if sandbox.state in _RESTARTABLE_STATES:
+        logger.info("Starting stopped sandbox %s …", sandbox.id)
+        sandbox.start(timeout=60)
+        logger.info("Sandbox %s is now started", sandbox.id)
+    elif sandbox.state in _UNRECOVERABLE_STATES:
+        logger.warning(
+            "Sandbox %s in unrecoverable state %s — creating a new one",
+            sandbox.id,
+            sandbox.state,
+        )
+        try:
+            client.delete(sandbox)
+        except Exception:
+            logger.debug(
+                "Could not delete broken sandbox %s", sandbox.id, exc_info=True
+            )
+        sandbox = _create_sandbox(client, thread_id, labels)
+        is_new = True
+        logger.info("Created replacement sandbox: %s", sandbox.id)
+    elif sandbox.state != SandboxState.STARTED:
+        sandbox.wait_for_sandbox_start(timeout=60)
 
     return _TimeoutAwareSandbox(sandbox=sandbox), is_new
 
 
-async def _get_thread_lock(key: str) -> asyncio.Lock:
-    """Return a per-thread asyncio lock, creating one if needed."""
-    async with _sandbox_locks_mu:
-        lock = _sandbox_locks.get(key)
-        if lock is None:
-            lock = asyncio.Lock()
-            _sandbox_locks[key] = lock
-        return lock
+@contextlib.asynccontextmanager
+async def _thread_lock(key: str) -> AsyncIterator[None]:
+    """Hold the per-thread lock for *key* (single-flight).
+
+    The lock is reference-counted and dropped once the last waiter
+    releases it, so ``_sandbox_locks`` does not grow with every thread
+    ever seen by this process.
+    """
+    lock = _sandbox_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _sandbox_locks[key] = lock
+    _sandbox_lock_refs[key] = _sandbox_lock_refs.get(key, 0) + 1
+    try:
+        async with lock:
+            yield
+    finally:
+        refs = _sandbox_lock_refs[key] - 1
+        if refs:
+            _sandbox_lock_refs[key] = refs
+        else:
+            del _sandbox_lock_refs[key]
+            _sandbox_locks.pop(key, None)
 
 
 async def get_or_create_sandbox(
@@ -174,34 +274,39 @@ async def get_or_create_sandbox(
 ) -> tuple[_TimeoutAwareSandbox, bool]:
     """Get or create a sandbox for a conversation thread.
 
-    Uses an in-process cache keyed by thread_id so subsequent messages
+    Uses an in-process LRU cache keyed by thread_id so subsequent messages
     in the same conversation reuse the sandbox object without an API call.
-    A per-thread async lock prevents duplicate sandbox creation from
-    concurrent requests.
+    Cache hits return without taking a lock; on a miss a per-thread async
+    lock ensures only one coroutine runs the Daytona lookup/create while
+    concurrent callers for the same thread wait for its result.
 
     Returns:
         Tuple of (sandbox, is_new). *is_new* is True when a fresh sandbox
         was created, signalling that file tracking should be reset.
     """
-    key = str(thread_id)
-    lock = await _get_thread_lock(key)
-
-    async with lock:
+    key = _as_key(thread_id)
+    cached = _sandbox_cache.get(key)
+    if cached is not None:
+        _sandbox_cache.move_to_end(key)
+        logger.info("Reusing cached sandbox for thread %s", key)
+        return cached, False
+
+    async with _thread_lock(key):
+        # A concurrent caller may have populated the cache while we waited.
         cached = _sandbox_cache.get(key)
         if cached is not None:
-            logger.info("Reusing cached sandbox for thread %s", key)
+            _sandbox_cache.move_to_end(key)
             return cached, False
-        sandbox, is_new = await asyncio.to_thread(_find_or_create, key)
+        sandbox, is_new = await _run_daytona(_find_or_create, key)
         _sandbox_cache[key] = sandbox
+        _sandbox_cache.move_to_end(key)
 
+        # LRU eviction: the least recently used entry sits at the front.
         if len(_sandbox_cache) > _SANDBOX_CACHE_MAX_SIZE:
-            oldest_key = next(iter(_sandbox_cache))
-            if oldest_key != key:
-                evicted = _sandbox_cache.pop(oldest_key, None)
-                _seeded_files.pop(oldest_key, None)
-                logger.debug("Evicted sandbox cache entry: %s", oldest_key)
-                if evicted is not None:
-                    _schedule_sandbox_delete(evicted)
+            oldest_key, evicted = _sandbox_cache.popitem(last=False)
+            _seeded_files.pop(oldest_key, None)
+            logger.debug("Evicted sandbox cache entry: %s", oldest_key)
+            _schedule_sandbox_delete(evicted)
 
         return sandbox, is_new
 
@@ -219,7 +324,7 @@ def _schedule_sandbox_delete(sandbox: _TimeoutAwareSandbox) -> None:
 
     try:
         loop = asyncio.get_running_loop()
-        loop.run_in_executor(None, _delete)
+        loop.run_in_executor(_daytona_executor, _delete)
     except RuntimeError:
         pass
 
@@ -236,7 +341,7 @@ async def sync_files_to_sandbox(
     tracking dict and uploads only what has changed.  When *is_new* is True
     the tracking is reset so every file is re-uploaded.
     """
-    key = str(thread_id)
+    key = _as_key(thread_id)
     if is_new:
         _seeded_files.pop(key, None)
 
@@ -257,7 +362,7 @@ async def sync_files_to_sandbox(
     def _upload() -> None:
         sandbox.upload_files(to_upload)
 
-    await asyncio.to_thread(_upload)
+    await _run_daytona(_upload)
 
     new_tracked = dict(tracked)
     for vpath, fdata in files.items():
@@ -267,24 +372,29 @@ async def sync_files_to_sandbox(
 
 
 def _evict_sandbox_cache(thread_id: int | str) -> None:
-    key = str(thread_id)
+    """Forget everything cached for a thread, including a create cool-down.
+
+    Eviction is an explicit reset (delete, or the execute tool's one retry),
+    so the next ``get_or_create_sandbox`` must really attempt a create.
+    """
+    key = _as_key(thread_id)
     _sandbox_cache.pop(key, None)
     _seeded_files.pop(key, None)
+    _create_failures.pop(key, None)
 
 
 async def delete_sandbox(thread_id: int | str) -> None:
     """Delete the sandbox for a conversation thread."""
-    _evict_sandbox_cache(thread_id)
+    key = _as_key(thread_id)
+    _evict_sandbox_cache(key)
 
     def _delete() -> None:
         client = _get_client()
-        labels = {THREAD_LABEL_KEY: str(thread_id)}
+        labels = {THREAD_LABEL_KEY: key}
         try:
             sandbox = client.find_one(labels=labels)
         except DaytonaError:
-            logger.debug(
-                "No sandbox to delete for thread %s (already removed)", thread_id
-            )
+            logger.debug("No sandbox to delete for thread %s (already removed)", key)
             return
         try:
             client.delete(sandbox)
@@ -292,11 +402,11 @@ async def delete_sandbox(thread_id: int | str) -> None:
         except Exception:
             logger.warning(
                 "Failed to delete sandbox for thread %s",
-                thread_id,
+                key,
                 exc_info=True,
             )
 
-    await asyncio.to_thread(_delete)
+    await _run_daytona(_delete)
 
 
 # ---------------------------------------------------------------------------
@@ -304,36 +414,100 @@ async def delete_sandbox(thread_id: int | str) -> None:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def _get_sandbox_files_dir() -> Path:
     return Path(app_config.SANDBOX_FILES_DIR)
 
 
-def _local_path_for(thread_id: int | str, sandbox_path: str) -> Path:
-    """Map a sandbox-internal absolute path to a local filesystem path."""
-    relative = sandbox_path.lstrip("/")
-    base = (_get_sandbox_files_dir() / str(thread_id)).resolve()
-    target = (base / relative).resolve()
+def _thread_files_dir(key: str) -> Path:
+    """Resolved local directory holding a thread's persisted files."""
+    return (_get_sandbox_files_dir() / key).resolve()
+
+
+def _local_path_for(key: str, sandbox_path: str, *, base: Path | None = None) -> Path:
+    """Map a sandbox-internal absolute path to a local filesystem path.
+
+    Pass *base* (from ``_thread_files_dir``) when mapping many paths for
+    the same thread to avoid re-resolving the thread directory each time.
+    """
+    if base is None:
+        base = _thread_files_dir(key)
+    target = (base / sandbox_path.lstrip("/")).resolve()
     if not target.is_relative_to(base):
         raise ValueError(f"Path traversal blocked: {sandbox_path}")
     return target
 
 
-def get_local_sandbox_file(thread_id: int | str, sandbox_path: str) -> bytes | None:
-    """Read a previously-persisted sandbox file from local storage.
+def _write_bytes_atomic(target: Path, content: bytes) -> None:
+    """Write *content* to a sibling temp file, then rename it into place.
 
-    Returns the file bytes, or *None* if the file does not exist locally.
+    A crash mid-write leaves the previous file (or nothing) rather than a
+    truncated one that ``get_local_sandbox_file`` would serve.  The temp
+    file lives in the same directory, so ``os.replace`` never crosses
+    filesystems, and gets a unique name so concurrent writers of the same
+    target never share (or clobber) one.
     """
-    local = _local_path_for(thread_id, sandbox_path)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(content)
+        os.replace(tmp, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _read_local_sandbox_file(key: str, sandbox_path: str) -> bytes | None:
+    local = _local_path_for(key, sandbox_path)
     if local.is_file():
         return local.read_bytes()
     return None
 
 
-def delete_local_sandbox_files(thread_id: int | str) -> None:
+async def get_local_sandbox_file(
+    thread_id: int | str, sandbox_path: str
+) -> bytes | None:
+    """Read a previously-persisted sandbox file from local storage.
+
+    The disk read runs in a worker thread so multi-MB artifacts don't
+    stall the event loop.  Returns the file bytes, or *None* if the file
+    does not exist locally.
+    """
+    return await asyncio.to_thread(
+        _read_local_sandbox_file, _as_key(thread_id), sandbox_path
+    )
+
+
+def _on_rmtree_error(func: Callable[..., Any], path: str, exc: BaseException) -> None:
+    """``shutil.rmtree`` error hook: retry once with owner permissions, then
+    log instead of silently leaking the entry on disk."""
+    try:
+        os.chmod(path, stat.S_IRWXU)
+        func(path)
+    except OSError:
+        logger.warning("Could not remove %s", path, exc_info=exc)
+
+
+def _rmtree_fast(path: Path) -> None:
+    """Recursively delete *path*, preferring native ``rm -rf`` on POSIX.
+
+    ``shutil.rmtree`` pays one Python-level call per entry, which is slow
+    on thread directories holding thousands of persisted artifacts.
+    """
+    rm = shutil.which("rm") if os.name == "posix" else None
+    if rm is not None:
+        subprocess.run([rm, "-rf", "--", str(path)], check=False)
+        if not path.exists():
+            return
+    shutil.rmtree(path, onexc=_on_rmtree_error)
+
+
+async def delete_local_sandbox_files(thread_id: int | str) -> None:
     """Remove all locally-persisted sandbox files for a thread."""
-    thread_dir = _get_sandbox_files_dir() / str(thread_id)
+    thread_dir = _get_sandbox_files_dir() / _as_key(thread_id)
     if thread_dir.is_dir():
-        shutil.rmtree(thread_dir, ignore_errors=True)
+        await asyncio.to_thread(_rmtree_fast, thread_dir)
         logger.info("Deleted local sandbox files for thread %s", thread_id)
 
 
@@ -345,22 +519,34 @@ async def persist_and_delete_sandbox(
 
     Each file in *sandbox_file_paths* is downloaded from the Daytona
     sandbox and saved under ``{SANDBOX_FILES_DIR}/{thread_id}/…``.
-    Per-file errors are logged but do **not** prevent the sandbox from
-    being deleted — freeing Daytona storage is the priority.
+    Downloads run concurrently (bounded by
+    ``_PERSIST_DOWNLOAD_CONCURRENCY``) since each one is a blocking HTTP
+    round-trip.  Per-file errors are logged but do **not** prevent the
+    sandbox from being deleted — freeing Daytona storage is the priority.
     """
-    _evict_sandbox_cache(thread_id)
+    key = _as_key(thread_id)
+    _evict_sandbox_cache(key)
 
-    def _persist_and_delete() -> None:
+    def _find_started() -> tuple[Daytona, Sandbox] | None:
+        # The first call builds the Daytona client (blocking I/O), so it is
+        # resolved here in the worker thread rather than on the event loop.
         client = _get_client()
-        labels = {THREAD_LABEL_KEY: str(thread_id)}
+        labels = {THREAD_LABEL_KEY: key}
 
         try:
             sandbox = client.find_one(labels=labels)
+        except DaytonaError:
+            logger.info("No sandbox found for thread %s — nothing to persist", key)
+            return None
         except Exception:
-            logger.info(
-                "No sandbox found for thread %s — nothing to persist", thread_id
+            # A transient API/network failure is not "no sandbox": surface it
+            # rather than skipping the persist and losing the files.
+            logger.warning(
+                "Sandbox lookup failed for thread %s — files not persisted",
+                key,
+                exc_info=True,
             )
-            return
+            raise
 
         # Ensure the sandbox is running so we can download files
         if sandbox.state != SandboxState.STARTED:
@@ -374,23 +560,61 @@ async def persist_and_delete_sandbox(
                 )
                 with contextlib.suppress(Exception):
                     client.delete(sandbox)
-                return
+                return None
+        return client, sandbox
 
+    found = await _run_daytona(_find_started)
+    if found is None:
+        return
+    client, sandbox = found
+
+    def _prepare_targets() -> dict[str, Path]:
+        """Map each sandbox path to its local target and create the parent
+        directories once, instead of a ``mkdir`` per downloaded file."""
+        thread_dir = _thread_files_dir(key)
+        targets: dict[str, Path] = {}
         for path in sandbox_file_paths:
             try:
-                content: bytes = sandbox.fs.download_file(path)
-                local = _local_path_for(thread_id, path)
-                local.parent.mkdir(parents=True, exist_ok=True)
-                local.write_bytes(content)
+                targets[path] = _local_path_for(key, path, base=thread_dir)
+            except ValueError:
+                logger.warning(
+                    "Skipping sandbox file %s for thread %s",
+                    path,
+                    key,
+                    exc_info=True,
+                )
+        for parent in {local.parent for local in targets.values()}:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                # The per-file write below will fail and be logged.
+                logger.warning("Could not create %s", parent, exc_info=True)
+        return targets
+
+    targets = await asyncio.to_thread(_prepare_targets)
+
+    def _persist_one(path: str, local: Path) -> None:
+        content: bytes = sandbox.fs.download_file(path)
+        _write_bytes_atomic(local, content)
+
+    semaphore = asyncio.Semaphore(_PERSIST_DOWNLOAD_CONCURRENCY)
+
+    async def _persist(path: str, local: Path) -> None:
+        async with semaphore:
+            try:
+                await _run_daytona(_persist_one, path, local)
                 logger.info("Persisted sandbox file %s → %s", path, local)
             except Exception:
                 logger.warning(
                     "Failed to persist sandbox file %s for thread %s",
                     path,
-                    thread_id,
+                    key,
                     exc_info=True,
                 )
 
+    await asyncio.gather(*(_persist(path, local) for path, local in targets.items()))
+
+    def _delete() -> None:
         try:
             client.delete(sandbox)
             logger.info("Sandbox deleted after file persistence: %s", sandbox.id)
@@ -401,4 +625,4 @@ async def persist_and_delete_sandbox(
                 exc_info=True,
             )
 
-    await asyncio.to_thread(_persist_and_delete)
+    await _run_daytona(_delete)
@@ -8,12 +8,13 @@ documents, each carrying its matched chunks in reading order.
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import time
+from functools import lru_cache
 
-from sqlalchemy import func, select, text
+from sqlalchemy import Integer, any_, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only
 
 from app.config import config
 from app.db import Chunk, Document, DocumentType
@@ -22,10 +23,11 @@ from app.utils.perf import get_perf_logger
 
 from .models import ChunkHit, DocumentHit, SearchScope
 
-_RRF_K = 60
+RRF_K = 60  # reciprocal-rank-fusion damping constant
 _CANDIDATE_MULTIPLIER = 5  # fused-chunk pool size relative to top_k
 _MAX_PASSAGES_PER_DOC = 12
 _SURFACE = "chunks"
+_DOCUMENT_TYPES: dict[str, DocumentType] = dict(DocumentType.__members__)
 
 
 async def search_chunks(
@@ -87,9 +89,7 @@ async def _search(
         return []
 
     if query_embedding is None:
-        query_embedding = await asyncio.to_thread(
-            config.embedding_model_instance.embed, query
-        )
+        query_embedding = await embed_query(query)
 
     conditions = _base_conditions(workspace_id, scope, document_types)
     rows = await _fused_chunks(
@@ -102,17 +102,39 @@ async def _search(
     return _group_into_documents(rows, top_k=top_k)
 
 
+async def embed_query(query: str) -> list[float]:
+    """Embed ``query`` off the event loop (the model call is synchronous).
+
+    Repeated queries (retried or re-issued tool calls) are served from a small
+    LRU instead of running the model again. Each caller gets its own list, so
+    mutating a returned vector can never corrupt the cached one.
+    """
+    vector = await asyncio.to_thread(
+        _embed_cached, id(config.embedding_model_instance), query
+    )
+    return list(vector)
+
+
+@lru_cache(maxsize=256)
+def _embed_cached(model_id: int, query: str) -> tuple[float, ...]:
+    # Keyed on the identity of the live model instance, so swapping it never
+    # serves vectors from the old one; stored as a tuple so the entry is
+    # immutable. Code that patches ``embed`` in place must ``cache_clear()``.
+    return tuple(map(float, config.embedding_model_instance.embed(query)))
+
+
+def has_searchable_types(document_types: tuple[str, ...] | None) -> bool:
+    """False when a type filter names no known type, so the search can't match."""
+    return _resolve_document_types(document_types) != []
+
+
 def _resolve_document_types(
     raw: tuple[str, ...] | None,
 ) -> list[DocumentType] | None:
     """Map type names to enum members; ``None`` when unfiltered, ``[]`` if all unknown."""
     if not raw:
         return None
-    resolved: list[DocumentType] = []
-    for name in raw:
-        with contextlib.suppress(KeyError):
-            resolved.append(DocumentType[name])
-    return resolved
+    return [_DOCUMENT_TYPES[name] for name in raw if name in _DOCUMENT_TYPES]
 
 
 def _base_conditions(
@@ -128,7 +150,11 @@ def _base_conditions(
     if document_types:
         conditions.append(Document.document_type.in_(document_types))
     if scope.document_ids:
-        conditions.append(Document.id.in_(scope.document_ids))
+        # ``= ANY(:ids)`` binds one array, so the statement text (and its
+        # prepared-statement cache entry) doesn't vary with the pin count.
+        conditions.append(
+            Document.id == any_(literal(list(scope.document_ids), ARRAY(Integer)))
+        )
     if scope.start_date is not None:
         conditions.append(Document.updated_at >= scope.start_date)
     if scope.end_date is not None:
@@ -177,20 +203,41 @@ async def _fused_chunks(
         .cte("keyword_search")
     )
 
-    fused = (
+    score = func.coalesce(1.0 / (RRF_K + semantic.c.rank), 0.0) + func.coalesce(
+        1.0 / (RRF_K + keyword.c.rank), 0.0
+    )
+    # Rank within each document so the passage cap is applied by Postgres and
+    # chunks that would be dropped anyway are never hydrated.
+    scored = (
         select(
-            Chunk,
-            (
-                func.coalesce(1.0 / (_RRF_K + semantic.c.rank), 0.0)
-                + func.coalesce(1.0 / (_RRF_K + keyword.c.rank), 0.0)
-            ).label("score"),
+            Chunk.id,
+            score.label("score"),
+            func.row_number()
+            .over(partition_by=Chunk.document_id, order_by=score.desc())
+            .label("doc_rank"),
         )
         .select_from(
             semantic.outerjoin(keyword, semantic.c.id == keyword.c.id, full=True)
         )
         .join(Chunk, Chunk.id == func.coalesce(semantic.c.id, keyword.c.id))
-        .options(joinedload(Chunk.document))
-        .order_by(text("score DESC"))
+        .cte("scored_chunks")
+    )
+
+    fused = (
+        select(Chunk, scored.c.score)
+        .join(scored, Chunk.id == scored.c.id)
+        .where(scored.c.doc_rank <= _MAX_PASSAGES_PER_DOC)
+        .options(
+            # Only what the hits carry: skips embeddings and full document bodies.
+            load_only(Chunk.id, Chunk.content, Chunk.position, Chunk.document_id),
+            joinedload(Chunk.document, innerjoin=True).load_only(
+                Document.id,
+                Document.title,
+                Document.document_type,
+                Document.document_metadata,
+            ),
+        )
+        .order_by(scored.c.score.desc())
         .limit(candidate_pool)
     )
 
@@ -200,19 +247,17 @@ async def _fused_chunks(
 
 def _group_into_documents(rows, *, top_k: int) -> list[DocumentHit]:
     """Group fused chunks by document, keep the top_k best, order chunks for reading."""
-    chunks_by_doc: dict[int, list[ChunkHit]] = {}
-    document_by_id: dict[int, Document] = {}
-    best_score: dict[int, float] = {}
-    order: list[int] = []
+    # Rows arrive best-first, so a document's first row carries its best score
+    # and insertion order is rank order.
+    grouped: dict[int, tuple[Document, float, list[ChunkHit]]] = {}
 
     for chunk, score in rows:
-        document_id = chunk.document.id
-        if document_id not in chunks_by_doc:
-            chunks_by_doc[document_id] = []
-            document_by_id[document_id] = chunk.document
-            best_score[document_id] = float(score)
-            order.append(document_id)
-        chunks_by_doc[document_id].append(
+        entry = grouped.get(chunk.document_id)
+        if entry is None:
+            if len(grouped) == top_k:
+                continue
+            entry = grouped[chunk.document_id] = (chunk.document, float(score), [])
+        entry[2].append(
             ChunkHit(
                 chunk_id=chunk.id,
                 content=chunk.content,
@@ -223,23 +268,20 @@ def _group_into_documents(rows, *, top_k: int) -> list[DocumentHit]:
 
     return [
         DocumentHit(
-            document_id=document_id,
-            title=document_by_id[document_id].title,
-            document_type=_type_value(document_by_id[document_id]),
-            metadata=document_by_id[document_id].document_metadata or {},
-            score=best_score[document_id],
-            chunks=_reading_order(chunks_by_doc[document_id]),
+            document_id=document.id,
+            title=document.title,
+            document_type=_type_value(document),
+            metadata=document.document_metadata or {},
+            score=best_score,
+            chunks=_reading_order(chunks),
         )
-        for document_id in order[:top_k]
+        for document, best_score, chunks in grouped.values()
     ]
 
 
 def _reading_order(chunks: list[ChunkHit]) -> list[ChunkHit]:
-    """Keep the most relevant chunks, then present them in document order."""
-    most_relevant = sorted(chunks, key=lambda c: c.score, reverse=True)[
-        :_MAX_PASSAGES_PER_DOC
-    ]
-    return sorted(most_relevant, key=lambda c: c.position)
+    """Present a document's matched chunks (capped in SQL) in document order."""
+    return sorted(chunks, key=lambda c: c.position)
 
 
 def _type_value(document: Document) -> str | None:
@@ -247,4 +289,4 @@ def _type_value(document: Document) -> str | None:
     return document_type.value if document_type is not None else None
 
 
-__all__ = ["search_chunks"]
+__all__ = ["embed_query", "search_chunks"]
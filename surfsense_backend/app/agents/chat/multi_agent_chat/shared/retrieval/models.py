@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchScope:
     """Filters narrowing a search; ``None``/empty means "whole knowledge base"."""
 
@@ -22,7 +22,7 @@ class SearchScope:
     end_date: datetime | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChunkHit:
     """One matched chunk, with the position that orders it within its document."""
 
@@ -32,7 +32,7 @@ class ChunkHit:
     score: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DocumentHit:
     """A document and the chunks that matched the query, ordered by position."""
 
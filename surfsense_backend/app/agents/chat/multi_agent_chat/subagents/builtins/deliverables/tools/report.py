@@ -12,8 +12,18 @@ from langchain_core.messages import HumanMessage
 from langchain_core.tools import tool
 from langgraph.types import Command
 
+from app.agents.chat.multi_agent_chat.shared.document_render import source_label
 from app.agents.chat.multi_agent_chat.shared.receipts.command import with_receipt
 from app.agents.chat.multi_agent_chat.shared.receipts.receipt import make_receipt
+from app.agents.chat.multi_agent_chat.shared.retrieval.hybrid_search import (
+    RRF_K,
+    embed_query,
+    search_chunks,
+)
+from app.agents.chat.multi_agent_chat.shared.retrieval.models import (
+    DocumentHit,
+    SearchScope,
+)
 from app.agents.chat.multi_agent_chat.subagents.builtins.deliverables.tools.thread_resolver import (
     resolve_root_thread_id,
 )
@@ -41,23 +51,50 @@ def _report_search_types(
     return tuple(sorted(types)) or None
 
 
+# Upper bound on KB documents fed to the report writer; up to five queries at
+# ``top_k=10`` would otherwise pour ~50 documents into the source text.
+_REPORT_KB_MAX_DOCUMENTS = 20
+
+# Per-query budget for the report's KB searches (embedding + hybrid SQL).
+_REPORT_KB_QUERY_TIMEOUT_SECONDS = 20
+
+
+def _merge_report_hits(
+    hits_per_query: list[list[DocumentHit]], limit: int = _REPORT_KB_MAX_DOCUMENTS
+) -> list[DocumentHit]:
+    """Fuse per-query KB hits with reciprocal rank fusion and keep the top ``limit``.
+
+    A document found by several queries scores ``sum(1 / (RRF_K + rank))`` over
+    them, so the cap keeps the documents most queries agree on instead of
+    whichever query happened to run first.
+    """
+    hits_by_id: dict[int, DocumentHit] = {}
+    scores: dict[int, float] = {}
+    for hits in hits_per_query:
+        for rank, hit in enumerate(hits, start=1):
+            hits_by_id.setdefault(hit.document_id, hit)
+            scores[hit.document_id] = scores.get(hit.document_id, 0.0) + 1.0 / (
+                RRF_K + rank
+            )
+    ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [hits_by_id[document_id] for document_id in ranked[:limit]]
+
+
 def _render_kb_hits_for_report(hits: list[Any]) -> str:
     """Render KB hits as plain titled source text for the report writer.
 
     Citations are intentionally omitted from reports for now, so no ``[n]``
     labels or chunk ids are emitted — just titled document content for grounding.
     """
-    from app.agents.chat.multi_agent_chat.shared.document_render import source_label
-
     blocks: list[str] = []
     for hit in hits:
-        label = source_label(hit.document_type, hit.metadata)
-        header = f"{hit.title} ({label})" if label else hit.title
         body = "\n\n".join(
-            chunk.content.strip() for chunk in hit.chunks if chunk.content.strip()
+            text for chunk in hit.chunks if (text := chunk.content.strip())
         )
         if not body:
             continue
+        label = source_label(hit.document_type, hit.metadata)
+        header = f"{hit.title} ({label})" if label else hit.title
         blocks.append(f"## {header}\n\n{body}")
     return "\n\n".join(blocks)
 
@@ -827,22 +864,17 @@ def create_generate_report_tool(
                     f"{query_count} queries: {search_queries[:5]}"
                 )
                 try:
-                    from app.agents.chat.multi_agent_chat.shared.retrieval.hybrid_search import (
-                        search_chunks,
-                    )
-                    from app.agents.chat.multi_agent_chat.shared.retrieval.models import (
-                        DocumentHit,
-                        SearchScope,
-                    )
-
                     scope = SearchScope(
                         document_types=_report_search_types(
                             available_connectors, available_document_types
                         )
                     )
 
-                    # Each query gets its own short-lived session.
-                    async def _run_single_query(q: str) -> list[DocumentHit]:
+                    # Each query gets its own short-lived session, opened only
+                    # once the embedding is ready so no pooled connection sits
+                    # idle behind the embedding call.
+                    async def _search_single_query(q: str) -> list[DocumentHit]:
+                        query_embedding = await embed_query(q)
                         async with shielded_async_session() as kb_session:
                             return await search_chunks(
                                 kb_session,
@@ -850,20 +882,29 @@ def create_generate_report_tool(
                                 query=q,
                                 scope=scope,
                                 top_k=10,
+                                query_embedding=query_embedding,
+                            )
+
+                    # A stuck query contributes nothing instead of holding the
+                    # whole gather (and the report) hostage.
+                    async def _run_single_query(q: str) -> list[DocumentHit]:
+                        try:
+                            return await asyncio.wait_for(
+                                _search_single_query(q),
+                                timeout=_REPORT_KB_QUERY_TIMEOUT_SECONDS,
+                            )
+                        except TimeoutError:
+                            logger.warning(
+                                f"[generate_report] KB query timed out after "
+                                f"{_REPORT_KB_QUERY_TIMEOUT_SECONDS}s: {q!r}"
                             )
+                            return []
 
                     hits_per_query = await asyncio.gather(
                         *[_run_single_query(q) for q in search_queries[:5]]
                     )
 
-                    seen_doc_ids: set[int] = set()
-                    merged_hits: list[DocumentHit] = []
-                    for hits in hits_per_query:
-                        for hit in hits:
-                            if hit.document_id in seen_doc_ids:
-                                continue
-                            seen_doc_ids.add(hit.document_id)
-                            merged_hits.append(hit)
+                    merged_hits = _merge_report_hits(hits_per_query)
 
                     kb_combined = _render_kb_hits_for_report(merged_hits)
                     if kb_combined.strip():
@@ -11,6 +11,7 @@ subagent boundary (reducer-backed, forwarded by ``task``/``ask_knowledge_base``)
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Annotated, Any
 
@@ -23,6 +24,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.agents.chat.multi_agent_chat.shared.citations import load_registry
 from app.agents.chat.multi_agent_chat.shared.retrieval import SearchScope, build_context
 from app.agents.chat.multi_agent_chat.shared.retrieval.hybrid_search import (
+    embed_query,
+    has_searchable_types,
     search_chunks,
 )
 from app.agents.chat.multi_agent_chat.shared.state.filesystem_state import (
@@ -119,6 +122,7 @@ def create_search_knowledge_base_tool(
 
     _space_id = workspace_id
     _document_types = _search_types(available_connectors, available_document_types)
+    _searchable = has_searchable_types(_document_types)
 
     async def _impl(
         query: Annotated[
@@ -139,21 +143,38 @@ def create_search_knowledge_base_tool(
         registry = load_registry(getattr(runtime, "state", None))
 
         t0 = time.perf_counter()
-        async with shielded_async_session() as session:
-            scope = await _build_search_scope(
-                session,
-                workspace_id=_space_id,
-                document_types=_document_types,
-                runtime=runtime,
-            )
-            hits = await search_chunks(
-                session,
-                workspace_id=_space_id,
-                query=cleaned_query,
-                scope=scope,
-                top_k=clamped_top_k,
-            )
-            rendered = build_context(cleaned_query, hits, registry)
+        # Embed while the scope resolves so the pooled connection is not held
+        # across the embedding call; rendering happens after it is released.
+        # A type filter matching nothing short-circuits the search, so skip
+        # the model call entirely then.
+        embedding_task = (
+            asyncio.create_task(embed_query(cleaned_query)) if _searchable else None
+        )
+        try:
+            async with shielded_async_session() as session:
+                scope = await _build_search_scope(
+                    session,
+                    workspace_id=_space_id,
+                    document_types=_document_types,
+                    runtime=runtime,
+                )
+                hits = await search_chunks(
+                    session,
+                    workspace_id=_space_id,
+                    query=cleaned_query,
+                    scope=scope,
+                    top_k=clamped_top_k,
+                    query_embedding=(
+                        await embedding_task if embedding_task is not None else None
+                    ),
+                )
+        finally:
+            if embedding_task is not None:
+                # Cancel if scope resolution failed first, and retrieve the
+                # outcome so a failed embedding isn't reported as never awaited.
+                embedding_task.cancel()
+                await asyncio.gather(embedding_task, return_exceptions=True)
+        rendered = build_context(cleaned_query, hits, registry)
 
         _perf_log.info(
             "[search_knowledge_base] tool query=%r docs=%d in %.3fs",
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, Literal
 
@@ -14,6 +15,9 @@ from app.services.google_drive import GoogleDriveToolMetadataService
 
 logger = logging.getLogger(__name__)
 
+# Bounds the Drive API call so a hung request can't pin the tool's session.
+_DRIVE_API_TIMEOUT_SECONDS = 30
+
 _MIME_MAP: dict[str, str] = {
     "google_doc": GOOGLE_DOC,
     "google_sheet": GOOGLE_SHEET,
@@ -134,46 +138,24 @@ def create_create_google_drive_file_tool(
                     "message": f"Unsupported file type '{final_file_type}'.",
                 }
 
-            from sqlalchemy.future import select
-
-            from app.db import SearchSourceConnector, SearchSourceConnectorType
-
-            _drive_types = [
-                SearchSourceConnectorType.GOOGLE_DRIVE_CONNECTOR,
-                SearchSourceConnectorType.COMPOSIO_GOOGLE_DRIVE_CONNECTOR,
-            ]
+            from app.db import SearchSourceConnectorType
 
-            if final_connector_id is not None:
-                result = await db_session.execute(
-                    select(SearchSourceConnector).filter(
-                        SearchSourceConnector.id == final_connector_id,
-                        SearchSourceConnector.workspace_id == workspace_id,
-                        SearchSourceConnector.user_id == user_id,
-                        SearchSourceConnector.connector_type.in_(_drive_types),
-                    )
-                )
-                connector = result.scalars().first()
-                if not connector:
+            # Reuses the connectors get_creation_context already loaded, so
+            # the common (non-overridden) path needs no extra query.
+            connector = await metadata_service.get_drive_connector(
+                workspace_id, user_id, final_connector_id
+            )
+            if not connector:
+                if final_connector_id is not None:
                     return {
                         "status": "error",
                         "message": "Selected Google Drive connector is invalid or has been disconnected.",
                     }
-                actual_connector_id = connector.id
-            else:
-                result = await db_session.execute(
-                    select(SearchSourceConnector).filter(
-                        SearchSourceConnector.workspace_id == workspace_id,
-                        SearchSourceConnector.user_id == user_id,
-                        SearchSourceConnector.connector_type.in_(_drive_types),
-                    )
-                )
-                connector = result.scalars().first()
-                if not connector:
-                    return {
-                        "status": "error",
-                        "message": "No Google Drive connector found. Please connect Google Drive in your workspace settings.",
-                    }
-                actual_connector_id = connector.id
+                return {
+                    "status": "error",
+                    "message": "No Google Drive connector found. Please connect Google Drive in your workspace settings.",
+                }
+            actual_connector_id = connector.id
 
             logger.info(
                 f"Creating Google Drive file: name='{final_name}', type='{final_file_type}', connector={actual_connector_id}"
@@ -183,15 +165,12 @@ def create_create_google_drive_file_tool(
                 try:
                     from sqlalchemy.orm.attributes import flag_modified
 
-                    _res = await db_session.execute(
-                        select(SearchSourceConnector).where(
-                            SearchSourceConnector.id == actual_connector_id
-                        )
-                    )
-                    _conn = _res.scalar_one_or_none()
-                    if _conn and not _conn.config.get("auth_expired"):
-                        _conn.config = {**_conn.config, "auth_expired": True}
-                        flag_modified(_conn, "config")
+                    if not connector.config.get("auth_expired"):
+                        connector.config = {
+                            **connector.config,
+                            "auth_expired": True,
+                        }
+                        flag_modified(connector, "config")
                         await db_session.commit()
                 except Exception:
                     logger.warning(
@@ -250,13 +229,28 @@ def create_create_google_drive_file_tool(
                     session=db_session,
                     connector_id=actual_connector_id,
                 )
+                # Resolve credentials (DB read, maybe a token refresh) first so
+                # the timeout below bounds only the Drive API call itself.
+                await client.get_service()
                 try:
-                    created = await client.create_file(
-                        name=final_name,
-                        mime_type=mime_type,
-                        parent_folder_id=final_parent_folder_id,
-                        content=final_content,
+                    created = await asyncio.wait_for(
+                        client.create_file(
+                            name=final_name,
+                            mime_type=mime_type,
+                            parent_folder_id=final_parent_folder_id,
+                            content=final_content,
+                        ),
+                        timeout=_DRIVE_API_TIMEOUT_SECONDS,
                     )
+                except TimeoutError:
+                    logger.warning(
+                        "Google Drive create_file timed out for connector %s",
+                        actual_connector_id,
+                    )
+                    return {
+                        "status": "error",
+                        "message": "Google Drive timed out. The file may still have been created; check Drive before trying again.",
+                    }
                 except HttpError as http_err:
                     if http_err.resp.status == 403:
                         logger.warning(
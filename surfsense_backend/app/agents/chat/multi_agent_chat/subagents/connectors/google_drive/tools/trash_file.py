@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any
 
@@ -13,6 +14,9 @@ from app.services.google_drive import GoogleDriveToolMetadataService
 
 logger = logging.getLogger(__name__)
 
+# Bounds the Drive API call so a hung request can't pin the tool's session.
+_DRIVE_API_TIMEOUT_SECONDS = 30
+
 
 def create_delete_google_drive_file_tool(
     db_session: AsyncSession | None = None,
@@ -132,24 +136,13 @@ def create_delete_google_drive_file_tool(
                     "message": "No connector found for this file.",
                 }
 
-            from sqlalchemy.future import select
-
-            from app.db import SearchSourceConnector, SearchSourceConnectorType
+            from app.db import SearchSourceConnectorType
 
-            _drive_types = [
-                SearchSourceConnectorType.GOOGLE_DRIVE_CONNECTOR,
-                SearchSourceConnectorType.COMPOSIO_GOOGLE_DRIVE_CONNECTOR,
-            ]
-
-            result = await db_session.execute(
-                select(SearchSourceConnector).filter(
-                    SearchSourceConnector.id == final_connector_id,
-                    SearchSourceConnector.workspace_id == workspace_id,
-                    SearchSourceConnector.user_id == user_id,
-                    SearchSourceConnector.connector_type.in_(_drive_types),
-                )
+            # get_trash_context already loaded (and ownership-checked) the
+            # file's connector; only an edited connector_id costs a query.
+            connector = await metadata_service.get_drive_connector(
+                workspace_id, user_id, final_connector_id
             )
-            connector = result.scalars().first()
             if not connector:
                 return {
                     "status": "error",
@@ -224,8 +217,23 @@ def create_delete_google_drive_file_tool(
                     session=db_session,
                     connector_id=connector.id,
                 )
+                # Resolve credentials (DB read, maybe a token refresh) first so
+                # the timeout below bounds only the Drive API call itself.
+                await client.get_service()
                 try:
-                    await client.trash_file(file_id=final_file_id)
+                    await asyncio.wait_for(
+                        client.trash_file(file_id=final_file_id),
+                        timeout=_DRIVE_API_TIMEOUT_SECONDS,
+                    )
+                except TimeoutError:
+                    logger.warning(
+                        "Google Drive trash_file timed out for connector %s",
+                        connector.id,
+                    )
+                    return {
+                        "status": "error",
+                        "message": "Google Drive timed out. The file may still have been trashed; check Drive before trying again.",
+                    }
                 except HttpError as http_err:
                     if http_err.resp.status == 403:
                         logger.warning(
@@ -252,15 +260,25 @@ def create_delete_google_drive_file_tool(
             deleted_from_kb = False
             if final_delete_from_kb and document_id:
                 try:
+                    from sqlalchemy import delete
+
                     from app.db import Document
+                    from app.services.connector_service import (
+                        invalidate_connector_discovery_cache,
+                    )
 
-                    doc_result = await db_session.execute(
-                        select(Document).filter(Document.id == document_id)
+                    # One DELETE ... RETURNING instead of load-then-delete;
+                    # chunks go with it via the ON DELETE CASCADE foreign key.
+                    # A Core DELETE skips the ORM after_delete listener, so the
+                    # doc-type discovery cache is invalidated explicitly below.
+                    deleted = await db_session.execute(
+                        delete(Document)
+                        .where(Document.id == document_id)
+                        .returning(Document.id)
                     )
-                    document = doc_result.scalars().first()
-                    if document:
-                        await db_session.delete(document)
+                    if deleted.scalar_one_or_none() is not None:
                         await db_session.commit()
+                        invalidate_connector_discovery_cache(workspace_id)
                         deleted_from_kb = True
                         logger.info(
                             f"Deleted document {document_id} from knowledge base"
@@ -501,6 +501,18 @@ class Config:
     # CREATE INDEX / CREATE TABLE fails fast instead of hanging the FastAPI
     # lifespan forever behind another transaction's lock.
     DB_DDL_LOCK_TIMEOUT_MS = int(os.getenv("DB_DDL_LOCK_TIMEOUT_MS", "5000"))
+    # Web engine connection pool. pool_timeout (s) bounds how long a request
+    # waits for a checkout so pool exhaustion fails fast instead of stalling
+    # the agent loop behind other tool calls.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "30"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "150"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Per-connection LRU of prepared statements kept by SQLAlchemy's asyncpg
+    # dialect (its default is 100, which the app's statement mix overflows).
+    # Set 0 behind a transaction-pooling pgbouncer. Only applied to asyncpg.
+    DB_PREPARED_STATEMENT_CACHE_SIZE = int(
+        os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "500")
+    )
     # Global idle_in_transaction_session_timeout (ms) applied to every pooled
     # connection so an abandoned "idle in transaction" session can't wedge the
     # database indefinitely. 0 disables. Only applied to asyncpg connections.
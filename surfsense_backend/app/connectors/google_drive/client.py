@@ -341,32 +341,32 @@ class GoogleDriveClient:
                 )
 
         if media:
-            return (
-                service.files()
-                .create(
-                    body=body,
-                    media_body=media,
-                    fields="id,name,mimeType,webViewLink",
-                    supportsAllDrives=True,
-                )
-                .execute()
+            request = service.files().create(
+                body=body,
+                media_body=media,
+                fields="id,name,mimeType,webViewLink",
+                supportsAllDrives=True,
             )
-
-        return (
-            service.files()
-            .create(
+        else:
+            request = service.files().create(
                 body=body,
                 fields="id,name,mimeType,webViewLink",
                 supportsAllDrives=True,
             )
-            .execute()
-        )
+        return await self._execute_off_loop(request)
 
     async def trash_file(self, file_id: str) -> bool:
         service = await self.get_service()
-        service.files().update(
-            fileId=file_id,
-            body={"trashed": True},
-            supportsAllDrives=True,
-        ).execute()
+        await self._execute_off_loop(
+            service.files().update(
+                fileId=file_id,
+                body={"trashed": True},
+                supportsAllDrives=True,
+            )
+        )
         return True
+
+    async def _execute_off_loop(self, request) -> Any:
+        """Run a blocking API request on a worker thread with its own transport."""
+        http = _build_thread_http(self._resolved_credentials)
+        return await asyncio.to_thread(request.execute, http=http)
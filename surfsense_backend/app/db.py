@@ -2903,7 +2903,7 @@ from app.podcasts.persistence import (  # noqa: E402, F401
 
 def _build_connect_args() -> dict:
     """Build driver connect_args, including a protective idle-in-transaction
-    timeout for asyncpg connections.
+    timeout and the prepared-statement cache size for asyncpg connections.
 
     A single abandoned ``idle in transaction`` session can hold table/row locks
     indefinitely and wedge writes plus boot-time DDL (the classic "FastAPI
@@ -2913,9 +2913,16 @@ def _build_connect_args() -> dict:
     statements — only ones that opened a transaction and went idle.
     """
     connect_args: dict = {}
+    # Both settings are asyncpg-specific; only apply them for that driver.
+    if not (DATABASE_URL and "asyncpg" in DATABASE_URL):
+        return connect_args
+    # Repeated parameterized lookups (connector loads, permission checks) hit
+    # the per-connection cache instead of re-preparing on every call.
+    connect_args["prepared_statement_cache_size"] = (
+        config.DB_PREPARED_STATEMENT_CACHE_SIZE
+    )
     idle_ms = config.DB_IDLE_IN_TX_TIMEOUT_MS
-    # ``server_settings`` is asyncpg-specific; only apply it for that driver.
-    if idle_ms and idle_ms > 0 and DATABASE_URL and "asyncpg" in DATABASE_URL:
+    if idle_ms and idle_ms > 0:
         connect_args["server_settings"] = {
             "idle_in_transaction_session_timeout": str(idle_ms)
         }
@@ -2924,16 +2931,27 @@ def _build_connect_args() -> dict:
 
 engine = create_async_engine(
     DATABASE_URL,
-    pool_size=30,
-    max_overflow=150,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
     pool_recycle=1800,
     pool_pre_ping=True,
-    pool_timeout=30,
+    pool_timeout=config.DB_POOL_TIMEOUT,
     connect_args=_build_connect_args(),
 )
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
 
+def get_pool_stats() -> dict[str, int]:
+    """Snapshot of the web engine's connection pool, exported as OTel gauges."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+
+
 @asynccontextmanager
 async def shielded_async_session():
     """Cancellation-safe async session context manager.
@@ -51,8 +51,11 @@ class UploadDocumentAdapter:
         if not DocumentStatus.is_state(indexed.status, DocumentStatus.READY):
             raise RuntimeError(indexed.status.get("reason", "Indexing failed"))
 
-        indexed.content_needs_reindexing = False
-        await self._session.commit()
+        # index() has already committed the READY row; a fresh upload never
+        # carries the reindex flag, so only re-uploads pay for another commit.
+        if indexed.content_needs_reindexing:
+            indexed.content_needs_reindexing = False
+            await self._session.commit()
 
     async def reindex(self, document: Document) -> None:
         """Re-index an existing document after its source_markdown has been updated."""
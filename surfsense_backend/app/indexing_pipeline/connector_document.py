@@ -7,12 +7,13 @@ class ConnectorDocument(BaseModel):
     """Canonical data transfer object produced by connector adapters and consumed by the indexing pipeline."""
 
     title: str
-    source_markdown: str
+    # Kept out of repr so logging a document never dumps its full body.
+    source_markdown: str = Field(repr=False)
     unique_id: str
     document_type: DocumentType
     workspace_id: int = Field(gt=0)
     should_use_code_chunker: bool = False
-    metadata: dict = {}
+    metadata: dict = Field(default_factory=dict)
     connector_id: int | None = None
     created_by_id: str
     folder_id: int | None = None
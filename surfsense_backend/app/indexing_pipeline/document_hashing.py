@@ -20,5 +20,8 @@ def compute_unique_identifier_hash(doc: ConnectorDocument) -> str:
 
 def compute_content_hash(doc: ConnectorDocument) -> str:
     """Return a SHA-256 hash of the document's content scoped to its workspace."""
-    combined = f"{doc.workspace_id}:{doc.source_markdown}"
-    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+    # Feed the prefix and body separately so a large markdown body is not
+    # copied into a combined string before hashing.
+    h = hashlib.sha256(f"{doc.workspace_id}:".encode())
+    h.update(doc.source_markdown.encode("utf-8"))
+    return h.hexdigest()
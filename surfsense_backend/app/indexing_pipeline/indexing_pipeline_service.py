@@ -264,6 +264,9 @@ class IndexingPipelineService:
             unique_id="batch",
         )
 
+        # Hash each document once up front; a document that cannot be hashed is
+        # skipped on its own rather than aborting the batch.
+        hashed: list[tuple[ConnectorDocument, PipelineLogContext, str, str]] = []
         for connector_doc in connector_docs:
             ctx = PipelineLogContext(
                 connector_id=connector_doc.connector_id,
@@ -273,17 +276,35 @@ class IndexingPipelineService:
             try:
                 unique_identifier_hash = compute_unique_identifier_hash(connector_doc)
                 content_hash = compute_content_hash(connector_doc)
+            except Exception as e:
+                log_doc_skipped_unknown(ctx, e)
+                continue
+            if unique_identifier_hash in seen_hashes:
+                continue
+            seen_hashes.add(unique_identifier_hash)
+            hashed.append((connector_doc, ctx, unique_identifier_hash, content_hash))
 
-                if unique_identifier_hash in seen_hashes:
-                    continue
-                seen_hashes.add(unique_identifier_hash)
-
+        # One round-trip for every already-persisted document in the batch,
+        # instead of a lookup per document inside the loop below.
+        existing_by_hash: dict[str, Document] = {}
+        if seen_hashes:
+            try:
                 result = await self.session.execute(
-                    select(Document).filter(
-                        Document.unique_identifier_hash == unique_identifier_hash
+                    select(Document).where(
+                        Document.unique_identifier_hash.in_(seen_hashes)
                     )
                 )
-                existing = result.scalars().first()
+                existing_by_hash = {
+                    doc.unique_identifier_hash: doc for doc in result.scalars().all()
+                }
+            except Exception as e:
+                log_batch_aborted(batch_ctx, e)
+                await self.session.rollback()
+                return []
+
+        for connector_doc, ctx, unique_identifier_hash, content_hash in hashed:
+            try:
+                existing = existing_by_hash.get(unique_identifier_hash)
 
                 if existing is not None:
                     if existing.content_hash == content_hash:
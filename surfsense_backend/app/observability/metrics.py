@@ -939,6 +939,18 @@ def _observe_gc_collections(_options: Any) -> list[Any]:
     ]
 
 
+def _observe_db_pool_connections(_options: Any) -> list[Any]:
+    from opentelemetry.metrics import Observation
+
+    from app.db import get_pool_stats
+
+    stats = get_pool_stats()
+    return [
+        Observation(stats["checked_out"], {"db.client.connection.state": "used"}),
+        Observation(stats["checked_in"], {"db.client.connection.state": "idle"}),
+    ]
+
+
 def register_runtime_observables() -> None:
     """Register process/runtime observable gauges once per process."""
     global _OBSERVABLES_REGISTERED
@@ -947,8 +959,9 @@ def register_runtime_observables() -> None:
 
     meter = _get_meter()
     try:
-        # Each callback returns the value for a single gauge except GC, whose
-        # callback carries a generation attribute.
+        # Each callback returns the value for a single gauge except GC and the
+        # DB pool, whose callbacks carry a generation / connection-state
+        # attribute.
         meter.create_observable_gauge(
             "process.runtime.cpython.memory.rss",
             callbacks=[
@@ -993,6 +1006,12 @@ def register_runtime_observables() -> None:
             unit="{collection}",
             description="CPython GC counters by generation.",
         )
+        meter.create_observable_gauge(
+            "db.client.connection.count",
+            callbacks=[_observe_db_pool_connections],
+            unit="{connection}",
+            description="Web engine DB pool connections by state (used/idle).",
+        )
     except Exception:
         logger.warning("Failed to register OTel runtime observables", exc_info=True)
         return
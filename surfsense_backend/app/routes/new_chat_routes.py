@@ -498,7 +498,7 @@ def _try_delete_sandbox(thread_id: int) -> None:
                 exc_info=True,
             )
         try:
-            delete_local_sandbox_files(thread_id)
+            await delete_local_sandbox_files(thread_id)
         except Exception:
             _logger.warning(
                 "Local sandbox file cleanup failed for thread %s",
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -80,7 +79,7 @@ async def download_sandbox_file(
     )
 
     # Prefer locally-persisted copy (sandbox may already be deleted)
-    local_content = get_local_sandbox_file(thread_id, path)
+    local_content = await get_local_sandbox_file(thread_id, path)
     if local_content is not None:
         filename = path.rsplit("/", 1)[-1] if "/" in path else path
         media_type = _guess_media_type(filename)
@@ -93,7 +92,7 @@ async def download_sandbox_file(
     # Fall back to live sandbox download
     try:
         sandbox, _ = await get_or_create_sandbox(thread_id)
-        content: bytes = await asyncio.to_thread(sandbox.download_file, path)
+        content: bytes = await sandbox.adownload_file(path)
     except Exception as exc:
         logger.warning("Sandbox file download failed for %s: %s", path, exc)
         raise HTTPException(
@@ -17,6 +17,11 @@ from app.services.composio_service import ComposioService
 
 logger = logging.getLogger(__name__)
 
+_DRIVE_CONNECTOR_TYPES = (
+    SearchSourceConnectorType.GOOGLE_DRIVE_CONNECTOR,
+    SearchSourceConnectorType.COMPOSIO_GOOGLE_DRIVE_CONNECTOR,
+)
+
 
 @dataclass
 class GoogleDriveAccount:
@@ -66,6 +71,10 @@ class GoogleDriveFile:
 class GoogleDriveToolMetadataService:
     def __init__(self, db_session: AsyncSession):
         self._db_session = db_session
+        # Drive connectors already loaded by this service, by id, so the
+        # tool's follow-up connector lookup doesn't hit the database again.
+        self._connectors: dict[int, SearchSourceConnector] = {}
+        self._default_connector_id: int | None = None
 
     def _is_composio_connector(self, connector: SearchSourceConnector) -> bool:
         return (
@@ -131,11 +140,53 @@ class GoogleDriveToolMetadataService:
             "parent_folders": parent_folders,
         }
 
+    async def get_drive_connector(
+        self,
+        workspace_id: int,
+        user_id: str,
+        connector_id: int | None = None,
+    ) -> SearchSourceConnector | None:
+        """Return the user's Drive connector *connector_id* (or their default).
+
+        The default is the most recently indexed account, i.e. the first one
+        listed by :meth:`get_creation_context`.  Connectors that context
+        already loaded are returned without another query.
+        """
+        if connector_id is None:
+            connector_id = self._default_connector_id
+
+        connector = self._connectors.get(connector_id) if connector_id else None
+        if (
+            connector is not None
+            and connector.workspace_id == workspace_id
+            and str(connector.user_id) == str(user_id)
+        ):
+            return connector
+
+        filters = [
+            SearchSourceConnector.workspace_id == workspace_id,
+            SearchSourceConnector.user_id == user_id,
+            SearchSourceConnector.connector_type.in_(_DRIVE_CONNECTOR_TYPES),
+        ]
+        if connector_id is not None:
+            filters.append(SearchSourceConnector.id == connector_id)
+        result = await self._db_session.execute(
+            select(SearchSourceConnector)
+            .filter(*filters)
+            .order_by(SearchSourceConnector.last_indexed_at.desc())
+            .limit(1)
+        )
+        connector = result.scalars().first()
+        if connector is not None:
+            self._connectors[connector.id] = connector
+        return connector
+
     async def get_trash_context(
         self, workspace_id: int, user_id: str, file_name: str
     ) -> dict:
+        # Document and its (ownership-checked) connector in one round-trip.
         result = await self._db_session.execute(
-            select(Document)
+            select(Document, SearchSourceConnector)
             .join(
                 SearchSourceConnector, Document.connector_id == SearchSourceConnector.id
             )
@@ -145,14 +196,15 @@ class GoogleDriveToolMetadataService:
                     Document.document_type == DocumentType.GOOGLE_DRIVE_FILE,
                     func.lower(Document.title) == func.lower(file_name),
                     SearchSourceConnector.user_id == user_id,
+                    SearchSourceConnector.connector_type.in_(_DRIVE_CONNECTOR_TYPES),
                 )
             )
             .order_by(Document.updated_at.desc().nullslast())
             .limit(1)
         )
-        document = result.scalars().first()
+        row = result.first()
 
-        if not document:
+        if not row:
             return {
                 "error": (
                     f"File '{file_name}' not found in your indexed Google Drive files. "
@@ -161,27 +213,8 @@ class GoogleDriveToolMetadataService:
                 )
             }
 
-        if not document.connector_id:
-            return {"error": "Document has no associated connector"}
-
-        result = await self._db_session.execute(
-            select(SearchSourceConnector).filter(
-                and_(
-                    SearchSourceConnector.id == document.connector_id,
-                    SearchSourceConnector.user_id == user_id,
-                    SearchSourceConnector.connector_type.in_(
-                        [
-                            SearchSourceConnectorType.GOOGLE_DRIVE_CONNECTOR,
-                            SearchSourceConnectorType.COMPOSIO_GOOGLE_DRIVE_CONNECTOR,
-                        ]
-                    ),
-                )
-            )
-        )
-        connector = result.scalars().first()
-
-        if not connector:
-            return {"error": "Connector not found or access denied"}
+        document, connector = row
+        self._connectors[connector.id] = connector
 
         account = GoogleDriveAccount.from_connector(connector)
         file = GoogleDriveFile.from_document(document)
@@ -206,19 +239,28 @@ class GoogleDriveToolMetadataService:
                 and_(
                     SearchSourceConnector.workspace_id == workspace_id,
                     SearchSourceConnector.user_id == user_id,
-                    SearchSourceConnector.connector_type.in_(
-                        [
-                            SearchSourceConnectorType.GOOGLE_DRIVE_CONNECTOR,
-                            SearchSourceConnectorType.COMPOSIO_GOOGLE_DRIVE_CONNECTOR,
-                        ]
-                    ),
+                    SearchSourceConnector.connector_type.in_(_DRIVE_CONNECTOR_TYPES),
                 )
             )
             .order_by(SearchSourceConnector.last_indexed_at.desc())
         )
         connectors = result.scalars().all()
+        self._connectors.update((c.id, c) for c in connectors)
+        if connectors:
+            self._default_connector_id = connectors[0].id
         return [GoogleDriveAccount.from_connector(c) for c in connectors]
 
+    async def _load_connector(self, connector_id: int) -> SearchSourceConnector | None:
+        connector = self._connectors.get(connector_id)
+        if connector is None:
+            result = await self._db_session.execute(
+                select(SearchSourceConnector).where(
+                    SearchSourceConnector.id == connector_id
+                )
+            )
+            connector = result.scalar_one_or_none()
+        return connector
+
     async def _check_account_health(self, connector_id: int) -> bool:
         """Check if a Google Drive connector's credentials are still valid.
 
@@ -227,12 +269,7 @@ class GoogleDriveToolMetadataService:
         Returns True if the credentials are expired/invalid, False if healthy.
         """
         try:
-            result = await self._db_session.execute(
-                select(SearchSourceConnector).where(
-                    SearchSourceConnector.id == connector_id
-                )
-            )
-            connector = result.scalar_one_or_none()
+            connector = await self._load_connector(connector_id)
             if not connector:
                 return True
 
@@ -302,12 +339,7 @@ class GoogleDriveToolMetadataService:
                 continue
 
             try:
-                result = await self._db_session.execute(
-                    select(SearchSourceConnector).where(
-                        SearchSourceConnector.id == connector_id
-                    )
-                )
-                connector = result.scalar_one_or_none()
+                connector = await self._load_connector(connector_id)
                 if not connector:
                     parent_folders[connector_id] = []
                     continue
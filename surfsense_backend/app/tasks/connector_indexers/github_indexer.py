@@ -9,6 +9,7 @@ Implements 2-phase document status updates for real-time UI feedback:
 - Phase 2: Process each document: pending → processing → ready/failed
 """
 
+import asyncio
 import contextlib
 import time
 from collections.abc import Awaitable, Callable
@@ -23,6 +24,7 @@ from app.services.task_logging_service import TaskLoggingService
 from app.utils.document_converters import (
     create_document_chunks,
     embed_text,
+    embed_texts,
     generate_content_hash,
     generate_unique_identifier_hash,
 )
@@ -517,16 +519,16 @@ async def _simple_chunk_content(content: str, chunk_size: int = 4000) -> list:
     """
     from app.db import Chunk
 
-    chunks = []
-    for i in range(0, len(content), chunk_size):
-        chunk_text = content[i : i + chunk_size]
-        if chunk_text.strip():
-            chunks.append(
-                Chunk(
-                    content=chunk_text,
-                    embedding=embed_text(chunk_text),
-                    position=len(chunks),
-                )
-            )
-
-    return chunks
+    chunk_texts = [
+        chunk_text
+        for i in range(0, len(content), chunk_size)
+        if (chunk_text := content[i : i + chunk_size]).strip()
+    ]
+    embeddings = await asyncio.to_thread(embed_texts, chunk_texts)
+
+    return [
+        Chunk(content=chunk_text, embedding=embedding, position=position)
+        for position, (chunk_text, embedding) in enumerate(
+            zip(chunk_texts, embeddings, strict=True)
+        )
+    ]
@@ -259,8 +259,9 @@ async def convert_document_to_markdown(elements):
 
 def generate_content_hash(content: str, workspace_id: int) -> str:
     """Generate SHA-256 hash for the given content combined with workspace ID."""
-    combined_data = f"{workspace_id}:{content}"
-    return hashlib.sha256(combined_data.encode("utf-8")).hexdigest()
+    h = hashlib.sha256(f"{workspace_id}:".encode())
+    h.update(content.encode("utf-8"))
+    return h.hexdigest()
 
 
 def generate_unique_identifier_hash(
@@ -25,6 +25,7 @@ from langchain_core.messages import ToolMessage
 from langgraph.types import Command
 
 from app.agents.chat.multi_agent_chat.shared.citations import CitationRegistry
+from app.agents.chat.multi_agent_chat.shared.retrieval import hybrid_search
 from app.agents.chat.multi_agent_chat.subagents.builtins.knowledge_base.tools import (
     search_knowledge_base,
 )
@@ -89,6 +90,14 @@ def _tool_uses_test_session(db_session, monkeypatch):
     monkeypatch.setattr(search_knowledge_base, "shielded_async_session", _session)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_query_embeddings():
+    """Drop cached query vectors so each test sees its own pinned embedding."""
+    hybrid_search._embed_cached.cache_clear()
+    yield
+    hybrid_search._embed_cached.cache_clear()
+
+
 @pytest.fixture
 def _pinned_embedding(monkeypatch):
     monkeypatch.setattr(
@@ -11,6 +11,7 @@ import pytest_asyncio
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.agents.chat.multi_agent_chat.shared.retrieval import hybrid_search
 from app.config import config as app_config
 from app.db import (
     Chunk,
@@ -218,6 +219,14 @@ def patched_session_factory(async_engine, monkeypatch):
     return test_maker
 
 
+@pytest.fixture(autouse=True)
+def _fresh_query_embeddings():
+    """Drop cached query vectors so a pinned ``embed`` is never bypassed."""
+    hybrid_search._embed_cached.cache_clear()
+    yield
+    hybrid_search._embed_cached.cache_clear()
+
+
 @pytest.fixture
 def patched_embed(monkeypatch):
     """Mock the embedding model (system boundary) to return a fixed vector."""
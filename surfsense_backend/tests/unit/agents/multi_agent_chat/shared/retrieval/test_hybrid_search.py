@@ -0,0 +1,177 @@
+"""Tests for the SQL shape of the hybrid chunk search."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.agents.chat.multi_agent_chat.shared.retrieval import SearchScope, hybrid_search
+from app.config import config
+
+pytestmark = pytest.mark.unit
+
+
+class _CapturingSession:
+    def __init__(self) -> None:
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any) -> Any:
+        self.statements.append(statement)
+
+        class _Result:
+            def all(self) -> list:
+                return []
+
+        return _Result()
+
+
+async def test_passage_cap_is_pushed_into_sql() -> None:
+    session = _CapturingSession()
+
+    rows = await hybrid_search._fused_chunks(
+        session,
+        query="launch",
+        query_embedding=[0.0] * config.embedding_model_instance.dimension,
+        conditions=[],
+        candidate_pool=25,
+    )
+
+    assert rows == []
+    compiled = session.statements[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "row_number() OVER (PARTITION BY chunks.document_id" in sql
+    assert "scored_chunks.doc_rank <= " in sql
+    assert hybrid_search._MAX_PASSAGES_PER_DOC in compiled.params.values()
+
+
+async def test_only_hit_columns_are_selected() -> None:
+    session = _CapturingSession()
+
+    await hybrid_search._fused_chunks(
+        session,
+        query="launch",
+        query_embedding=[0.0] * config.embedding_model_instance.dimension,
+        conditions=[],
+        candidate_pool=25,
+    )
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    select_list = sql.rsplit(" SELECT ", 1)[1].split("\nFROM ", 1)[0]
+    assert "chunks.content" in select_list
+    assert "documents_1.title" in select_list
+    assert "chunks.embedding" not in select_list
+    assert "documents_1.content" not in select_list
+    assert "documents_1.source_markdown" not in select_list
+
+
+def test_resolve_document_types_drops_unknown_names() -> None:
+    assert hybrid_search._resolve_document_types(None) is None
+    assert hybrid_search._resolve_document_types(("FILE", "NOPE")) == [
+        hybrid_search.DocumentType.FILE
+    ]
+    assert hybrid_search._resolve_document_types(("NOPE",)) == []
+
+
+def test_has_searchable_types_rejects_only_all_unknown_filters() -> None:
+    assert hybrid_search.has_searchable_types(None)
+    assert hybrid_search.has_searchable_types(("FILE", "NOPE"))
+    assert not hybrid_search.has_searchable_types(("NOPE",))
+
+
+@pytest.mark.parametrize("document_ids", [(1,), (1, 2, 3, 4)])
+def test_document_id_scope_binds_a_single_array(document_ids) -> None:
+    conditions = hybrid_search._base_conditions(
+        7, SearchScope(document_ids=document_ids), None
+    )
+
+    compiled = conditions[-1].compile(dialect=postgresql.dialect())
+    assert str(compiled) == "documents.id = ANY (%(param_1)s::INTEGER[])"
+    assert compiled.params == {"param_1": list(document_ids)}
+
+
+def test_group_into_documents_keeps_top_k_in_rank_order() -> None:
+    def _row(chunk_id: int, document, position: int, score: float):
+        chunk = SimpleNamespace(
+            id=chunk_id,
+            content=f"c{chunk_id}",
+            position=position,
+            document_id=document.id,
+            document=document,
+        )
+        return chunk, score
+
+    a, b, c = (
+        SimpleNamespace(
+            id=i, title=f"Doc {i}", document_type=None, document_metadata=None
+        )
+        for i in (1, 2, 3)
+    )
+    rows = [
+        _row(10, b, 5, 0.9),
+        _row(11, a, 1, 0.8),
+        _row(12, b, 2, 0.7),
+        _row(13, c, 0, 0.6),
+    ]
+
+    hits = hybrid_search._group_into_documents(rows, top_k=2)
+
+    assert [hit.document_id for hit in hits] == [2, 1]
+    assert [hit.score for hit in hits] == [0.9, 0.8]
+    assert [chunk.chunk_id for chunk in hits[0].chunks] == [12, 10]
+    assert hits[1].metadata == {}
+
+
+async def test_embed_query_reuses_vectors_for_repeated_queries(monkeypatch) -> None:
+    calls: list[str] = []
+
+    class _Model:
+        def embed(self, text: str) -> list[float]:
+            calls.append(text)
+            return [float(len(text))]
+
+    monkeypatch.setattr(config, "embedding_model_instance", _Model())
+    hybrid_search._embed_cached.cache_clear()
+
+    first = await hybrid_search.embed_query("quarterly plan")
+    again = await hybrid_search.embed_query("quarterly plan")
+    other = await hybrid_search.embed_query("roadmap")
+
+    assert first == again == [14.0]
+    assert other == [7.0]
+    assert calls == ["quarterly plan", "roadmap"]
+
+
+async def test_embed_query_hands_out_independent_copies(monkeypatch) -> None:
+    class _Model:
+        def embed(self, text: str) -> list[float]:
+            return [1.0, 2.0]
+
+    monkeypatch.setattr(config, "embedding_model_instance", _Model())
+    hybrid_search._embed_cached.cache_clear()
+
+    first = await hybrid_search.embed_query("launch")
+    first[0] = 99.0
+
+    assert await hybrid_search.embed_query("launch") == [1.0, 2.0]
+
+
+async def test_embed_query_cache_is_keyed_on_model_instance(monkeypatch) -> None:
+    calls: list[str] = []
+
+    class _Model:
+        def embed(self, text: str) -> list[float]:
+            calls.append(text)
+            return [0.0]
+
+    first_model, second_model = _Model(), _Model()
+    hybrid_search._embed_cached.cache_clear()
+
+    monkeypatch.setattr(config, "embedding_model_instance", first_model)
+    await hybrid_search.embed_query("launch")
+    monkeypatch.setattr(config, "embedding_model_instance", second_model)
+    await hybrid_search.embed_query("launch")
+
+    assert calls == ["launch", "launch"]
@@ -0,0 +1,51 @@
+"""Tests for how ``generate_report`` merges KB hits across its search queries."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.agents.chat.multi_agent_chat.shared.retrieval.models import DocumentHit
+from app.agents.chat.multi_agent_chat.subagents.builtins.deliverables.tools.report import (
+    _merge_report_hits,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _hit(document_id: int, score: float = 0.0) -> DocumentHit:
+    return DocumentHit(
+        document_id=document_id,
+        title=f"doc {document_id}",
+        document_type="FILE",
+        metadata={},
+        score=score,
+    )
+
+
+def test_merge_drops_documents_repeated_across_queries() -> None:
+    merged = _merge_report_hits([[_hit(1), _hit(2)], [_hit(2), _hit(3)]])
+
+    assert sorted(hit.document_id for hit in merged) == [1, 2, 3]
+
+
+def test_merge_stops_at_the_document_limit() -> None:
+    merged = _merge_report_hits([[_hit(i) for i in range(10)]], limit=5)
+
+    assert [hit.document_id for hit in merged] == [0, 1, 2, 3, 4]
+
+
+def test_merge_ranks_documents_found_by_several_queries_first() -> None:
+    merged = _merge_report_hits(
+        [[_hit(1), _hit(2), _hit(3)], [_hit(4), _hit(3)], [_hit(5), _hit(3)]],
+        limit=2,
+    )
+
+    assert [hit.document_id for hit in merged] == [3, 1]
+
+
+def test_merge_scores_a_document_missing_from_some_queries() -> None:
+    # 7 tops the first query but is absent from the second: 1/61 ≈ 0.0164.
+    # 8 (1/62 + 1/61 ≈ 0.0325) and 9 (1/63 + 1/62 ≈ 0.0320) appear in both.
+    merged = _merge_report_hits([[_hit(7), _hit(8), _hit(9)], [_hit(8), _hit(9)]])
+
+    assert [hit.document_id for hit in merged] == [8, 9, 7]
@@ -0,0 +1,59 @@
+"""Tests for GoogleDriveClient write calls (create_file, trash_file)."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+
+from app.connectors.google_drive import client as client_module
+from app.connectors.google_drive.client import GoogleDriveClient
+
+pytestmark = pytest.mark.unit
+
+
+_CREDENTIALS = Credentials(token="test-token")
+
+
+def _client_with_request(monkeypatch, request) -> GoogleDriveClient:
+    """A client whose service is built by ``get_service`` from real credentials."""
+    service = MagicMock()
+    service.files.return_value.update.return_value = request
+    service.files.return_value.create.return_value = request
+    monkeypatch.setattr(client_module, "build", lambda *_args, **_kwargs: service)
+    return GoogleDriveClient(
+        session=MagicMock(), connector_id=1, credentials=_CREDENTIALS
+    )
+
+
+class _RecordingRequest:
+    def __init__(self, response):
+        self.response = response
+        self.thread: str | None = None
+        self.http = None
+
+    def execute(self, http=None):
+        self.thread = threading.current_thread().name
+        self.http = http
+        return self.response
+
+
+async def test_trash_file_executes_off_the_event_loop(monkeypatch):
+    request = _RecordingRequest({})
+    client = _client_with_request(monkeypatch, request)
+
+    assert await client.trash_file("file-1") is True
+    assert request.thread != threading.current_thread().name
+    assert isinstance(request.http, AuthorizedHttp)
+    assert request.http.credentials is _CREDENTIALS
+
+
+async def test_create_file_returns_the_api_response(monkeypatch):
+    request = _RecordingRequest({"id": "new-1", "name": "Notes"})
+    client = _client_with_request(monkeypatch, request)
+
+    created = await client.create_file(name="Notes", mime_type="text/plain")
+
+    assert created == {"id": "new-1", "name": "Notes"}
+    assert request.thread != threading.current_thread().name
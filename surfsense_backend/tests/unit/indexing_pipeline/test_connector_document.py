@@ -111,3 +111,10 @@ def test_empty_unique_id_raises():
             document_type=DocumentType.CLICKUP_CONNECTOR,
             workspace_id=1,
         )
+
+
+def test_repr_omits_source_markdown(make_connector_document):
+    """repr() stays small however large the document body is."""
+    doc = make_connector_document(source_markdown="x" * 100_000)
+    assert "source_markdown" not in repr(doc)
+    assert len(repr(doc)) < 1_000
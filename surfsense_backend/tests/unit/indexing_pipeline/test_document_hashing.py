@@ -6,7 +6,10 @@ from app.indexing_pipeline.document_hashing import (
     compute_identifier_hash,
     compute_unique_identifier_hash,
 )
-from app.utils.document_converters import generate_unique_identifier_hash
+from app.utils.document_converters import (
+    generate_content_hash,
+    generate_unique_identifier_hash,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -65,6 +68,12 @@ def test_different_content_produces_different_content_hash(make_connector_docume
     assert compute_content_hash(doc_a) != compute_content_hash(doc_b)
 
 
+def test_content_hash_matches_legacy_content_hash(make_connector_document):
+    """Pipeline and legacy content hashes agree, so unchanged docs are not re-indexed."""
+    doc = make_connector_document(source_markdown="# Title\n\nBody ✓", workspace_id=3)
+    assert compute_content_hash(doc) == generate_content_hash("# Title\n\nBody ✓", 3)
+
+
 def test_compute_identifier_hash_matches_connector_doc_hash(make_connector_document):
     """Raw-args hash equals ConnectorDocument hash for equivalent inputs."""
     doc = make_connector_document(
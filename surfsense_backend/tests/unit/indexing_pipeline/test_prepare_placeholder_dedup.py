@@ -12,8 +12,10 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from app.db import Document, DocumentStatus, DocumentType
+from app.indexing_pipeline import indexing_pipeline_service as service_module
 from app.indexing_pipeline.connector_document import ConnectorDocument
 from app.indexing_pipeline.document_hashing import (
+    compute_content_hash,
     compute_unique_identifier_hash,
 )
 from app.indexing_pipeline.indexing_pipeline_service import IndexingPipelineService
@@ -54,13 +56,13 @@ def _make_existing_doc(connector_doc: ConnectorDocument, *, status: dict) -> Mag
 def _mock_session_for_dedup(existing_doc, *, has_duplicate: bool):
     """Build a session whose sequential execute() calls return:
 
-    1. The *existing_doc* for the unique_identifier_hash lookup.
+    1. The *existing_doc* for the batch unique_identifier_hash lookup.
     2. A row (or None) for the duplicate content_hash check.
     """
     session = AsyncMock()
 
     existing_result = MagicMock()
-    existing_result.scalars.return_value.first.return_value = existing_doc
+    existing_result.scalars.return_value.all.return_value = [existing_doc]
 
     dup_result = MagicMock()
     dup_result.scalars.return_value.first.return_value = 42 if has_duplicate else None
@@ -108,3 +110,56 @@ async def test_ready_document_with_duplicate_content_is_left_untouched():
 
     assert DocumentStatus.is_state(existing.status, DocumentStatus.READY)
     session.delete.assert_not_called()
+
+
+async def test_existing_documents_are_loaded_in_one_query():
+    """Unchanged documents in a batch are resolved from a single bulk lookup."""
+    cdocs = [_make_connector_doc(unique_id=f"file-{i}") for i in range(3)]
+    existing = []
+    for cdoc in cdocs:
+        doc = _make_existing_doc(cdoc, status=DocumentStatus.ready())
+        doc.content_hash = compute_content_hash(cdoc)
+        existing.append(doc)
+
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = existing
+    session.execute = AsyncMock(return_value=result)
+    pipeline = IndexingPipelineService(session)
+
+    results = await pipeline.prepare_for_indexing(cdocs)
+
+    assert results == []
+    session.execute.assert_awaited_once()
+
+
+async def test_unhashable_document_is_skipped_without_aborting_the_batch(
+    monkeypatch,
+):
+    """A document whose hash fails is skipped; the rest of the batch proceeds."""
+    good = _make_connector_doc(unique_id="file-good")
+    bad = _make_connector_doc(unique_id="file-bad")
+    real_hash = service_module.compute_unique_identifier_hash
+
+    def _hash(doc: ConnectorDocument) -> str:
+        if doc.unique_id == "file-bad":
+            raise ValueError("malformed document")
+        return real_hash(doc)
+
+    monkeypatch.setattr(service_module, "compute_unique_identifier_hash", _hash)
+
+    existing = _make_existing_doc(good, status=DocumentStatus.ready())
+    existing.content_hash = compute_content_hash(good)
+
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [existing]
+    session.execute = AsyncMock(return_value=result)
+    pipeline = IndexingPipelineService(session)
+
+    results = await pipeline.prepare_for_indexing([bad, good])
+
+    assert results == []
+    session.execute.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+    session.commit.assert_awaited_once()
@@ -0,0 +1,309 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents.chat.multi_agent_chat.shared.middleware.filesystem import sandbox
+from app.agents.chat.multi_agent_chat.shared.middleware.filesystem.tools.execute_code import (
+    helpers,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _isolated_sandbox_cache():
+    sandbox._sandbox_cache.clear()
+    sandbox._sandbox_locks.clear()
+    sandbox._sandbox_lock_refs.clear()
+    sandbox._seeded_files.clear()
+    sandbox._create_failures.clear()
+    yield
+    sandbox._sandbox_cache.clear()
+    sandbox._sandbox_locks.clear()
+    sandbox._sandbox_lock_refs.clear()
+    sandbox._seeded_files.clear()
+    sandbox._create_failures.clear()
+
+
+@pytest.fixture
+def fake_find_or_create(monkeypatch):
+    calls: list[str] = []
+
+    def _fake(thread_id: str):
+        calls.append(thread_id)
+        return object(), True
+
+    monkeypatch.setattr(sandbox, "_find_or_create", _fake)
+    monkeypatch.setattr(sandbox, "_schedule_sandbox_delete", lambda _sb: None)
+    return calls
+
+
+async def test_cache_hit_skips_find_or_create(fake_find_or_create):
+    first, is_new = await sandbox.get_or_create_sandbox(1)
+    second, is_new_again = await sandbox.get_or_create_sandbox("1")
+
+    assert first is second
+    assert is_new is True
+    assert is_new_again is False
+    assert fake_find_or_create == ["1"]
+
+
+async def test_cache_evicts_least_recently_used(monkeypatch, fake_find_or_create):
+    monkeypatch.setattr(sandbox, "_SANDBOX_CACHE_MAX_SIZE", 2)
+
+    await sandbox.get_or_create_sandbox("a")
+    await sandbox.get_or_create_sandbox("b")
+    # Touch "a" so "b" becomes the least recently used entry.
+    await sandbox.get_or_create_sandbox("a")
+    await sandbox.get_or_create_sandbox("c")
+
+    assert list(sandbox._sandbox_cache) == ["a", "c"]
+    assert fake_find_or_create == ["a", "b", "c"]
+
+
+async def test_concurrent_misses_share_one_find_or_create(monkeypatch):
+    calls: list[str] = []
+
+    def _slow(thread_id: str):
+        calls.append(thread_id)
+        time.sleep(0.05)
+        return object(), True
+
+    monkeypatch.setattr(sandbox, "_find_or_create", _slow)
+
+    results = await asyncio.gather(
+        *(sandbox.get_or_create_sandbox(7) for _ in range(5))
+    )
+
+    assert calls == ["7"]
+    assert len({id(sb) for sb, _ in results}) == 1
+    assert sum(is_new for _, is_new in results) == 1
+    assert sandbox._sandbox_locks == {}
+
+
+async def test_delete_local_sandbox_files_removes_thread_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(sandbox, "_get_sandbox_files_dir", lambda: tmp_path)
+    nested = tmp_path / "9" / "home" / "daytona"
+    nested.mkdir(parents=True)
+    (nested / "out.csv").write_text("a,b\n")
+    (tmp_path / "10").mkdir()
+
+    await sandbox.delete_local_sandbox_files(9)
+
+    assert not (tmp_path / "9").exists()
+    assert (tmp_path / "10").is_dir()
+
+
+class _FakeFs:
+    def __init__(self, files: dict[str, bytes]):
+        self._files = files
+
+    def download_file(self, path: str) -> bytes:
+        return self._files[path]
+
+
+class _FakeDaytonaSandbox:
+    def __init__(self, files: dict[str, bytes]):
+        self.id = "sb-1"
+        self.state = sandbox.SandboxState.STARTED
+        self.fs = _FakeFs(files)
+
+
+class _FakeClient:
+    def __init__(self, remote: _FakeDaytonaSandbox):
+        self.remote = remote
+        self.deleted: list[str] = []
+
+    def find_one(self, labels):
+        return self.remote
+
+    def delete(self, sb):
+        self.deleted.append(sb.id)
+
+
+async def test_persist_and_delete_sandbox_saves_files_then_deletes(
+    monkeypatch, tmp_path
+):
+    remote = _FakeDaytonaSandbox(
+        {
+            "/home/daytona/out/a.txt": b"alpha",
+            "/home/daytona/out/b.txt": b"beta",
+        }
+    )
+    client = _FakeClient(remote)
+    monkeypatch.setattr(sandbox, "_get_client", lambda: client)
+    monkeypatch.setattr(sandbox, "_get_sandbox_files_dir", lambda: tmp_path)
+
+    await sandbox.persist_and_delete_sandbox(
+        3,
+        [
+            "/home/daytona/out/a.txt",
+            "/home/daytona/missing.txt",
+            "/home/daytona/out/b.txt",
+        ],
+    )
+
+    assert (tmp_path / "3/home/daytona/out/a.txt").read_bytes() == b"alpha"
+    assert (tmp_path / "3/home/daytona/out/b.txt").read_bytes() == b"beta"
+    assert not (tmp_path / "3/home/daytona/missing.txt").exists()
+    # No temp files left behind next to the persisted ones.
+    assert sorted(p.name for p in (tmp_path / "3/home/daytona/out").iterdir()) == [
+        "a.txt",
+        "b.txt",
+    ]
+    assert client.deleted == ["sb-1"]
+
+
+async def test_persist_resolves_client_off_the_event_loop(monkeypatch, tmp_path):
+    client = _FakeClient(_FakeDaytonaSandbox({"/home/daytona/out/a.txt": b"alpha"}))
+    callers: list[threading.Thread] = []
+
+    def _get_client():
+        callers.append(threading.current_thread())
+        return client
+
+    monkeypatch.setattr(sandbox, "_get_client", _get_client)
+    monkeypatch.setattr(sandbox, "_get_sandbox_files_dir", lambda: tmp_path)
+
+    await sandbox.persist_and_delete_sandbox(7, ["/home/daytona/out/a.txt"])
+
+    assert callers
+    assert threading.main_thread() not in callers
+    assert client.deleted == ["sb-1"]
+
+
+async def test_get_local_sandbox_file_reads_persisted_bytes(monkeypatch, tmp_path):
+    monkeypatch.setattr(sandbox, "_get_sandbox_files_dir", lambda: tmp_path)
+    target = tmp_path / "4" / "home" / "daytona" / "report.pdf"
+    target.parent.mkdir(parents=True)
+    target.write_bytes(b"%PDF")
+
+    assert await sandbox.get_local_sandbox_file(4, "/home/daytona/report.pdf") == (
+        b"%PDF"
+    )
+    assert await sandbox.get_local_sandbox_file(4, "/home/daytona/nope.pdf") is None
+
+
+async def test_failed_create_is_not_retried_during_cooldown(monkeypatch):
+    attempts: list[dict] = []
+
+    class _FailingClient:
+        def find_one(self, labels):
+            raise sandbox.DaytonaError("not found")
+
+        def create(self, params):
+            attempts.append(params.labels)
+            raise sandbox.DaytonaError("quota exceeded")
+
+    monkeypatch.setattr(sandbox, "_get_client", lambda: _FailingClient())
+
+    with pytest.raises(sandbox.DaytonaError):
+        await sandbox.get_or_create_sandbox(11)
+    with pytest.raises(RuntimeError, match="cooling down"):
+        await sandbox.get_or_create_sandbox(11)
+
+    assert len(attempts) == 1
+
+
+async def test_delete_local_sandbox_files_falls_back_to_rmtree(monkeypatch, tmp_path):
+    monkeypatch.setattr(sandbox, "_get_sandbox_files_dir", lambda: tmp_path)
+    monkeypatch.setattr(sandbox.shutil, "which", lambda _name: None)
+    (tmp_path / "12" / "out").mkdir(parents=True)
+    (tmp_path / "12" / "out" / "plot.png").write_bytes(b"png")
+
+    await sandbox.delete_local_sandbox_files("12")
+
+    assert not (tmp_path / "12").exists()
+
+
+def test_get_client_builds_one_client_under_concurrent_first_calls(monkeypatch):
+    built: list[object] = []
+
+    class _SlowDaytona:
+        def __init__(self, config):
+            time.sleep(0.05)
+            built.append(self)
+
+    monkeypatch.setattr(sandbox, "Daytona", _SlowDaytona)
+    monkeypatch.setattr(sandbox, "DaytonaConfig", lambda **_kwargs: None)
+    monkeypatch.setattr(sandbox, "_daytona_client", None)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: sandbox._get_client(), range(8)))
+
+    assert len(built) == 1
+    assert all(client is built[0] for client in clients)
+
+
+async def test_persist_propagates_non_daytona_lookup_failure(monkeypatch, tmp_path):
+    class _FlakyClient:
+        def __init__(self) -> None:
+            self.deleted: list[str] = []
+
+        def find_one(self, labels):
+            raise ConnectionError("connection reset")
+
+        def delete(self, sb):
+            self.deleted.append(sb.id)
+
+    client = _FlakyClient()
+    monkeypatch.setattr(sandbox, "_get_client", lambda: client)
+    monkeypatch.setattr(sandbox, "_get_sandbox_files_dir", lambda: tmp_path)
+
+    with pytest.raises(ConnectionError):
+        await sandbox.persist_and_delete_sandbox(5, ["/home/daytona/out/a.txt"])
+
+    assert client.deleted == []
+
+
+async def test_persist_treats_daytona_not_found_as_nothing_to_persist(
+    monkeypatch, tmp_path
+):
+    class _EmptyClient:
+        def find_one(self, labels):
+            raise sandbox.DaytonaError("not found")
+
+    monkeypatch.setattr(sandbox, "_get_client", lambda: _EmptyClient())
+    monkeypatch.setattr(sandbox, "_get_sandbox_files_dir", lambda: tmp_path)
+
+    await sandbox.persist_and_delete_sandbox(6, ["/home/daytona/out/a.txt"])
+
+    assert not (tmp_path / "6").exists()
+
+
+async def test_execute_retry_after_failed_create_attempts_a_fresh_create(
+    monkeypatch,
+):
+    creates: list[dict] = []
+
+    class _FlakyCreateClient:
+        def find_one(self, labels):
+            raise sandbox.DaytonaError("not found")
+
+        def create(self, params):
+            creates.append(params.labels)
+            if len(creates) == 1:
+                raise sandbox.DaytonaError("transient create failure")
+            return SimpleNamespace(id="sb-new")
+
+    class _FakeWrapped:
+        def __init__(self, sandbox):
+            self.id = sandbox.id
+
+        async def aexecute(self, command, timeout=None):
+            return SimpleNamespace(output="ok", exit_code=0, truncated=False)
+
+    monkeypatch.setattr(sandbox, "_get_client", lambda: _FlakyCreateClient())
+    monkeypatch.setattr(sandbox, "_TimeoutAwareSandbox", _FakeWrapped)
+
+    output = await helpers.execute_in_sandbox(
+        SimpleNamespace(_thread_id=21), "print('ok')", runtime=None, timeout=None
+    )
+
+    assert len(creates) == 2
+    assert output.startswith("ok")
+    assert sandbox._create_failures == {}
@@ -209,8 +209,9 @@ class TestMetricHelpers:
         metrics.register_runtime_observables()
         metrics.register_runtime_observables()
 
-        assert len(fake_meter.names) == 6
+        assert len(fake_meter.names) == 7
         assert fake_meter.names.count("python.asyncio.tasks") == 1
+        assert fake_meter.names.count("db.client.connection.count") == 1
         monkeypatch.setattr(metrics, "_OBSERVABLES_REGISTERED", False)
 
 
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from app.services.google_drive import GoogleDriveToolMetadataService
+
+pytestmark = pytest.mark.unit
+
+_USER_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _connector(connector_id: int, workspace_id: int = 1):
+    return SimpleNamespace(
+        id=connector_id,
+        name=f"Drive {connector_id}",
+        workspace_id=workspace_id,
+        user_id=UUID(_USER_ID),
+    )
+
+
+def _session_returning(rows):
+    result = SimpleNamespace(
+        scalars=lambda: SimpleNamespace(all=lambda: rows, first=lambda: rows[0])
+    )
+    return SimpleNamespace(execute=AsyncMock(return_value=result))
+
+
+async def test_get_drive_connector_reuses_accounts_loaded_for_context():
+    first, second = _connector(5), _connector(9)
+    session = _session_returning([first, second])
+    service = GoogleDriveToolMetadataService(session)
+
+    await service._get_google_drive_accounts(1, _USER_ID)
+    default = await service.get_drive_connector(1, _USER_ID)
+    explicit = await service.get_drive_connector(1, _USER_ID, 9)
+
+    assert default is first
+    assert explicit is second
+    assert session.execute.await_count == 1
+
+
+async def test_get_drive_connector_queries_when_not_loaded_for_workspace():
+    connector = _connector(5, workspace_id=2)
+    session = _session_returning([connector])
+    service = GoogleDriveToolMetadataService(session)
+    service._connectors[5] = connector
+
+    assert await service.get_drive_connector(1, _USER_ID, 5) is connector
+    assert session.execute.await_count == 1
+
+
+async def test_get_trash_context_loads_document_and_connector_together(monkeypatch):
+    connector = _connector(5)
+    document = SimpleNamespace(
+        id=42,
+        title="Budget",
+        connector_id=5,
+        document_metadata={"google_drive_file_id": "drive-42"},
+    )
+    result = SimpleNamespace(first=lambda: (document, connector))
+    session = SimpleNamespace(execute=AsyncMock(return_value=result))
+    service = GoogleDriveToolMetadataService(session)
+    monkeypatch.setattr(service, "_check_account_health", AsyncMock(return_value=False))
+
+    context = await service.get_trash_context(1, _USER_ID, "budget")
+
+    assert context["file"]["file_id"] == "drive-42"
+    assert context["account"] == {"id": 5, "name": "Drive 5", "auth_expired": False}
+    assert session.execute.await_count == 1
+    assert await service.get_drive_connector(1, _USER_ID, 5) is connector